@@ -7,22 +7,57 @@ Author: High Velocity Solutions LLC
 License: MIT
 """
 
-import tkinter as tk
-from tkinter import ttk, messagebox, filedialog
-import configparser
+from __future__ import annotations
+
 import os
 import shutil
 import json
-import hashlib
 import re
 import sys
 import platform
+import time
 from datetime import datetime
 from pathlib import Path
-from typing import Optional, Dict, Any, List
+from typing import Optional, Dict, Any, List, Callable, Mapping
 from dataclasses import dataclass, field
+from types import MappingProxyType
+from functools import lru_cache, partial
+from contextlib import contextmanager
+from operator import itemgetter
 import logging
 
+# orjson is an optional speedup for profile (de)serialization; the stdlib json
+# module is used when it isn't installed.
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# tkinter is imported lazily by _import_tkinter() so the config helpers can be
+# imported without loading Tk (e.g. on systems without python3-tk installed).
+tk = None
+ttk = None
+messagebox = None
+filedialog = None
+tkfont = None
+
+
+def _import_tkinter() -> None:
+    """Import tkinter into the module namespace on first use."""
+    global tk, ttk, messagebox, filedialog, tkfont
+    if tk is None:
+        import tkinter
+        import tkinter.ttk
+        import tkinter.messagebox
+        import tkinter.filedialog
+        import tkinter.font
+        tk = tkinter
+        ttk = tkinter.ttk
+        messagebox = tkinter.messagebox
+        filedialog = tkinter.filedialog
+        tkfont = tkinter.font
+
+
 # Configure logging
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
 logger = logging.getLogger(__name__)
@@ -35,18 +70,32 @@ ARC_RAIDERS_APP_ID = "1808500"
 IS_WINDOWS = sys.platform == "win32"
 IS_LINUX = sys.platform.startswith("linux")
 
+# Config file location relative to %LOCALAPPDATA% (or its Proton equivalent)
+CONFIG_RELATIVE_PATH = Path("PioneerGame", "Saved", "Config", "WindowsClient", "GameUserSettings.ini")
+# %LOCALAPPDATA% inside a Proton compatdata directory
+PROTON_LOCALAPPDATA = Path("pfx", "drive_c", "users", "steamuser", "AppData", "Local")
+
 # =============================================================================
 # STEAM PATH RESOLUTION
 # =============================================================================
 
+# Steam install locations probed by find_steam_path, in order of preference
+_WINDOWS_STEAM_PATHS = (
+    Path("C:/Program Files (x86)/Steam"),
+    Path("C:/Program Files/Steam"),
+)
+# Relative to the user's home directory
+_LINUX_STEAM_PATHS = (
+    ".local/share/Steam",
+    ".steam/steam",
+    ".var/app/com.valvesoftware.Steam/.local/share/Steam",  # Flatpak
+)
+
+
 def find_steam_path() -> Optional[Path]:
     """Find the Steam installation directory based on platform."""
     if IS_WINDOWS:
-        # Try common Windows Steam paths
-        common_paths = [
-            Path("C:/Program Files (x86)/Steam"),
-            Path("C:/Program Files/Steam"),
-        ]
+        candidates = _WINDOWS_STEAM_PATHS
 
         # Also try registry lookup
         try:
@@ -55,28 +104,22 @@ def find_steam_path() -> Optional[Path]:
             install_path, _ = winreg.QueryValueEx(key, "InstallPath")
             winreg.CloseKey(key)
             if install_path:
-                common_paths.insert(0, Path(install_path))
+                candidates = (Path(install_path),) + candidates
         except Exception:
             pass  # Registry lookup failed, continue with common paths
 
-        for path in common_paths:
-            if path.exists() and path.is_dir():
-                logger.info(f"Found Steam at: {path}")
-                return path
-
     elif IS_LINUX:
-        # Try common Linux Steam paths
         home = Path.home()
-        common_paths = [
-            home / ".local/share/Steam",
-            home / ".steam/steam",
-            home / ".var/app/com.valvesoftware.Steam/.local/share/Steam",  # Flatpak
-        ]
+        candidates = tuple(home / path for path in _LINUX_STEAM_PATHS)
 
-        for path in common_paths:
-            if path.exists() and path.is_dir():
-                logger.info(f"Found Steam at: {path}")
-                return path
+    else:
+        candidates = ()
+
+    for path in candidates:
+        # is_dir() is False for missing paths, so one stat covers both checks
+        if path.is_dir():
+            logger.info(f"Found Steam at: {path}")
+            return path
 
     logger.warning("Steam installation not found")
     return None
@@ -179,13 +222,8 @@ def find_steam_libraries() -> List[Path]:
         return []
 
     library_folders_vdf = steam_path / "steamapps" / "libraryfolders.vdf"
-    if not library_folders_vdf.exists():
-        logger.warning(f"libraryfolders.vdf not found at {library_folders_vdf}")
-        return [steam_path]  # Return just the main Steam path
-
     try:
-        with open(library_folders_vdf, 'r', encoding='utf-8', errors='ignore') as f:
-            vdf_content = f.read()
+        vdf_content = library_folders_vdf.read_text(encoding='utf-8', errors='ignore')
 
         libraries = parse_vdf_library_folders(vdf_content)
 
@@ -193,14 +231,18 @@ def find_steam_libraries() -> List[Path]:
         if steam_path not in libraries:
             libraries.insert(0, steam_path)
 
-        # Filter to only existing paths
-        libraries = [lib for lib in libraries if lib.exists() and lib.is_dir()]
+        # Filter to only existing paths (is_dir() is False for missing ones)
+        libraries = [lib for lib in libraries if lib.is_dir()]
 
-        for lib in libraries:
-            logger.info(f"Found Steam library: {lib}")
+        if logger.isEnabledFor(logging.INFO):
+            for lib in libraries:
+                logger.info("Found Steam library: %s", lib)
 
         return libraries if libraries else [steam_path]
 
+    except FileNotFoundError:
+        logger.warning(f"libraryfolders.vdf not found at {library_folders_vdf}")
+        return [steam_path]  # Return just the main Steam path
     except Exception as e:
         logger.error(f"Failed to read libraryfolders.vdf: {e}")
         return [steam_path]
@@ -220,12 +262,11 @@ def find_proton_prefix(app_id: str) -> Optional[Path]:
 
     for library in libraries:
         compatdata_path = library / "steamapps" / "compatdata" / app_id
-        if compatdata_path.exists():
-            # Check that pfx directory exists to validate this is a real proton prefix
-            prefix_path = compatdata_path / "pfx"
-            if prefix_path.exists() and prefix_path.is_dir():
-                logger.info(f"Found Proton compatdata for app {app_id}: {compatdata_path}")
-                return compatdata_path  # Return compatdata, not pfx
+        # A pfx directory marks a real proton prefix; one is_dir() stat covers
+        # both compatdata_path and pfx existing
+        if (compatdata_path / "pfx").is_dir():
+            logger.info(f"Found Proton compatdata for app {app_id}: {compatdata_path}")
+            return compatdata_path  # Return compatdata, not pfx
 
     logger.warning(f"Proton prefix not found for app {app_id}")
     return None
@@ -238,14 +279,14 @@ def get_default_config_path() -> Optional[Path]:
         if not localappdata:
             # Fallback to constructing path
             localappdata = str(Path.home() / "AppData" / "Local")
-        return Path(localappdata) / "PioneerGame" / "Saved" / "Config" / "WindowsClient" / "GameUserSettings.ini"
+        return Path(localappdata) / CONFIG_RELATIVE_PATH
 
     elif IS_LINUX:
         # Find Proton compatdata directory for Arc Raiders
         compatdata_path = find_proton_prefix(ARC_RAIDERS_APP_ID)
         if compatdata_path:
             # Append pfx and the Windows path structure
-            return compatdata_path / "pfx" / "drive_c" / "users" / "steamuser" / "AppData" / "Local" / "PioneerGame" / "Saved" / "Config" / "WindowsClient" / "GameUserSettings.ini"
+            return compatdata_path / PROTON_LOCALAPPDATA / CONFIG_RELATIVE_PATH
         else:
             # Can't find Proton prefix - user will need to manually locate the file
             logger.warning("Proton prefix not found - Arc Raiders may not be installed or hasn't been run yet")
@@ -260,7 +301,11 @@ def get_default_config_path() -> Optional[Path]:
 # CONFIGURATION DEFINITIONS
 # =============================================================================
 
-@dataclass
+# dataclass(slots=True) is only available on Python 3.10+
+_DATACLASS_SLOTS = {'slots': True} if sys.version_info >= (3, 10) else {}
+
+
+@dataclass(frozen=True, **_DATACLASS_SLOTS)
 class SettingDefinition:
     """Defines a configuration setting with metadata."""
     key: str
@@ -269,11 +314,34 @@ class SettingDefinition:
     setting_type: str  # 'choice', 'boolean', 'number', 'slider'
     section: str
     category: str
-    options: list = field(default_factory=list)  # For choice type
+    options: tuple = ()  # For choice type, as (stored_value, display_name) pairs
     min_val: float = 0  # For number/slider
     max_val: float = 100  # For number/slider
     default: Any = None
     performance_impact: str = "Low"  # Low, Medium, High, Very High
+    # Default as written to the INI
+    default_str: str = field(init=False, repr=False, compare=False)
+    # Derived from options: display name -> stored value, and the reverse
+    value_map: Dict[str, str] = field(init=False, repr=False, compare=False)
+    reverse_map: Dict[str, str] = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self):
+        # Options may be declared as plain strings or (stored_value, display_name)
+        # tuples; normalize to pairs so consumers never need to check the shape.
+        options = tuple((opt, opt) if isinstance(opt, str) else tuple(opt) for opt in self.options)
+        object.__setattr__(self, 'options', options)
+        object.__setattr__(self, 'default_str', str(self.default))
+        object.__setattr__(self, 'value_map', MappingProxyType({opt[1]: opt[0] for opt in options}))
+        object.__setattr__(self, 'reverse_map', MappingProxyType({opt[0]: opt[1] for opt in options}))
+
+
+# INI section names, interned so the definitions share one object per section
+_SECTION_EMBARK = sys.intern("/Script/EmbarkUserSettings.EmbarkGameUserSettings")
+_SECTION_SCALABILITY = sys.intern("ScalabilityGroups")
+_SECTION_SYSTEM = sys.intern("SystemSettings")
+_SECTION_INPUT = sys.intern("/Script/Engine.InputSettings")
+_SECTION_GAME_USER = sys.intern("/Script/Engine.GameUserSettings")
+_SECTION_ENGINE = sys.intern("/Script/Engine.Engine")
 
 
 # All settings definitions with explanations
@@ -284,9 +352,9 @@ SETTINGS_DEFINITIONS = {
         display_name="Upscaling Technology",
         description="Choose which upscaling technology to use. DLSS (NVIDIA), XeSS (Intel), FSR (AMD), or None.",
         setting_type="choice",
-        section="/Script/EmbarkUserSettings.EmbarkGameUserSettings",
+        section=_SECTION_EMBARK,
         category="Upscaling",
-        options=["DLSS", "XeSS", "FSR3", "None"],
+        options=("DLSS", "XeSS", "FSR3", "None"),
         default="DLSS",
         performance_impact="Very High"
     ),
@@ -296,9 +364,9 @@ SETTINGS_DEFINITIONS = {
         description="DLAA=Native AA only (sharpest, slowest). Quality=67% render (balanced). "
                    "Balanced=58% (good FPS). Performance=50% (high FPS). Ultra Performance=33% (maximum FPS, blurry).",
         setting_type="choice",
-        section="/Script/EmbarkUserSettings.EmbarkGameUserSettings",
+        section=_SECTION_EMBARK,
         category="Upscaling",
-        options=["DLAA", "Quality", "Balanced", "Performance", "UltraPerformance"],
+        options=("DLAA", "Quality", "Balanced", "Performance", "UltraPerformance"),
         default="Quality",
         performance_impact="Very High"
     ),
@@ -308,9 +376,9 @@ SETTINGS_DEFINITIONS = {
         description="Transformer (DLSS 4) provides better motion clarity and less ghosting. "
                    "CNN is the older model with slightly better performance but more artifacts.",
         setting_type="choice",
-        section="/Script/EmbarkUserSettings.EmbarkGameUserSettings",
+        section=_SECTION_EMBARK,
         category="Upscaling",
-        options=["Transformer", "CNN"],
+        options=("Transformer", "CNN"),
         default="Transformer",
         performance_impact="Low"
     ),
@@ -319,9 +387,9 @@ SETTINGS_DEFINITIONS = {
         display_name="XeSS Quality Mode",
         description="Intel XeSS upscaling quality. Higher quality = lower performance.",
         setting_type="choice",
-        section="/Script/EmbarkUserSettings.EmbarkGameUserSettings",
+        section=_SECTION_EMBARK,
         category="Upscaling",
-        options=["NativeAA", "UltraQualityPlus", "UltraQuality", "Quality", "Balanced", "Performance", "UltraPerformance"],
+        options=("NativeAA", "UltraQualityPlus", "UltraQuality", "Quality", "Balanced", "Performance", "UltraPerformance"),
         default="Quality",
         performance_impact="Very High"
     ),
@@ -330,9 +398,9 @@ SETTINGS_DEFINITIONS = {
         display_name="FSR 3 Quality Mode",
         description="AMD FSR upscaling quality. Works on all GPUs.",
         setting_type="choice",
-        section="/Script/EmbarkUserSettings.EmbarkGameUserSettings",
+        section=_SECTION_EMBARK,
         category="Upscaling",
-        options=["NativeAA", "Quality", "Balanced", "Performance", "UltraPerformance"],
+        options=("NativeAA", "Quality", "Balanced", "Performance", "UltraPerformance"),
         default="Balanced",
         performance_impact="Very High"
     ),
@@ -344,9 +412,9 @@ SETTINGS_DEFINITIONS = {
         description="AI generates extra frames for smoother visuals. WARNING: Adds 15-30ms input latency! "
                    "On2X=Double FPS. Off recommended for competitive play.",
         setting_type="choice",
-        section="/Script/EmbarkUserSettings.EmbarkGameUserSettings",
+        section=_SECTION_EMBARK,
         category="Frame Generation",
-        options=["Off", "On", "On2X", "On3X", "On4X"],
+        options=("Off", "On", "On2X", "On3X", "On4X"),
         default="Off",
         performance_impact="Very High"
     ),
@@ -355,9 +423,9 @@ SETTINGS_DEFINITIONS = {
         display_name="FSR 3 Frame Generation",
         description="AMD frame generation. Works on all GPUs but adds latency.",
         setting_type="choice",
-        section="/Script/EmbarkUserSettings.EmbarkGameUserSettings",
+        section=_SECTION_EMBARK,
         category="Frame Generation",
-        options=["Off", "On"],
+        options=("Off", "On"),
         default="Off",
         performance_impact="Very High"
     ),
@@ -369,9 +437,9 @@ SETTINGS_DEFINITIONS = {
         description="Reduces input latency by 20-50%. Enabled=Standard mode. "
                    "Enabled+Boost=Keeps GPU clocks high (better for CPU-bound scenarios).",
         setting_type="choice",
-        section="/Script/EmbarkUserSettings.EmbarkGameUserSettings",
+        section=_SECTION_EMBARK,
         category="Latency",
-        options=["Disabled", "Enabled", "Enabled+Boost"],
+        options=("Disabled", "Enabled", "Enabled+Boost"),
         default="Enabled",
         performance_impact="Low"
     ),
@@ -381,9 +449,9 @@ SETTINGS_DEFINITIONS = {
         description="Reflex 2 feature that warps frames at display time. Can reduce latency by additional 50%. "
                    "May cause visual artifacts in some scenarios.",
         setting_type="choice",
-        section="/Script/EmbarkUserSettings.EmbarkGameUserSettings",
+        section=_SECTION_EMBARK,
         category="Latency",
-        options=["Off", "On"],
+        options=("Off", "On"),
         default="Off",
         performance_impact="Low"
     ),
@@ -392,7 +460,7 @@ SETTINGS_DEFINITIONS = {
         display_name="AMD Anti-Lag 2",
         description="AMD's latency reduction. Only works on AMD RDNA GPUs.",
         setting_type="boolean",
-        section="/Script/EmbarkUserSettings.EmbarkGameUserSettings",
+        section=_SECTION_EMBARK,
         category="Latency",
         default=True,
         performance_impact="Low"
@@ -405,9 +473,9 @@ SETTINGS_DEFINITIONS = {
         description="Ray-traced indirect lighting. Static=Off (best performance). "
                    "DynamicEpic=Highest quality but 25-45% performance cost!",
         setting_type="choice",
-        section="/Script/EmbarkUserSettings.EmbarkGameUserSettings",
+        section=_SECTION_EMBARK,
         category="Ray Tracing",
-        options=["Static", "DynamicLow", "DynamicMedium", "DynamicHigh", "DynamicEpic"],
+        options=("Static", "DynamicLow", "DynamicMedium", "DynamicHigh", "DynamicEpic"),
         default="DynamicHigh",
         performance_impact="Very High"
     ),
@@ -416,9 +484,9 @@ SETTINGS_DEFINITIONS = {
         display_name="RTX GI Resolution",
         description="Resolution of global illumination calculations. 0=Low, 3=Epic.",
         setting_type="choice",
-        section="/Script/EmbarkUserSettings.EmbarkGameUserSettings",
+        section=_SECTION_EMBARK,
         category="Ray Tracing",
-        options=[("0", "Low"), ("1", "Medium"), ("2", "High"), ("3", "Epic")],
+        options=(("0", "Low"), ("1", "Medium"), ("2", "High"), ("3", "Epic")),
         default="3",
         performance_impact="High"
     ),
@@ -430,9 +498,9 @@ SETTINGS_DEFINITIONS = {
         description="Exclusive=Lowest latency but slow Alt+Tab. Borderless=Seamless windows integration. "
                    "Windowed=Window mode.",
         setting_type="choice",
-        section="/Script/EmbarkUserSettings.EmbarkGameUserSettings",
+        section=_SECTION_EMBARK,
         category="Display",
-        options=[("0", "Exclusive Fullscreen"), ("1", "Borderless Windowed"), ("2", "Windowed")],
+        options=(("0", "Exclusive Fullscreen"), ("1", "Borderless Windowed"), ("2", "Windowed")),
         default="1",
         performance_impact="Low"
     ),
@@ -441,7 +509,7 @@ SETTINGS_DEFINITIONS = {
         display_name="VSync",
         description="Synchronizes frames to monitor refresh. OFF recommended with Reflex for lowest latency.",
         setting_type="boolean",
-        section="/Script/EmbarkUserSettings.EmbarkGameUserSettings",
+        section=_SECTION_EMBARK,
         category="Display",
         default=False,
         performance_impact="Medium"
@@ -451,7 +519,7 @@ SETTINGS_DEFINITIONS = {
         display_name="Frame Rate Limit",
         description="0=Unlimited. Set slightly below monitor refresh for G-Sync/FreeSync.",
         setting_type="number",
-        section="/Script/EmbarkUserSettings.EmbarkGameUserSettings",
+        section=_SECTION_EMBARK,
         category="Display",
         min_val=0,
         max_val=500,
@@ -463,7 +531,7 @@ SETTINGS_DEFINITIONS = {
         display_name="HDR Output",
         description="Enable HDR if your monitor supports it. Provides wider color range and brightness.",
         setting_type="boolean",
-        section="/Script/EmbarkUserSettings.EmbarkGameUserSettings",
+        section=_SECTION_EMBARK,
         category="Display",
         default=False,
         performance_impact="Low"
@@ -475,7 +543,7 @@ SETTINGS_DEFINITIONS = {
         display_name="Motion Blur",
         description="Blurs fast-moving objects. OFF recommended for competitive play.",
         setting_type="boolean",
-        section="/Script/EmbarkUserSettings.EmbarkGameUserSettings",
+        section=_SECTION_EMBARK,
         category="Visual Effects",
         default=False,
         performance_impact="Low"
@@ -485,7 +553,7 @@ SETTINGS_DEFINITIONS = {
         display_name="Lens Distortion",
         description="Simulates camera lens curvature. OFF for clearer image edges.",
         setting_type="boolean",
-        section="/Script/EmbarkUserSettings.EmbarkGameUserSettings",
+        section=_SECTION_EMBARK,
         category="Visual Effects",
         default=False,
         performance_impact="Low"
@@ -497,9 +565,9 @@ SETTINGS_DEFINITIONS = {
         display_name="View Distance",
         description="How far objects render before LOD/culling. Higher=see farther, more GPU load.",
         setting_type="choice",
-        section="ScalabilityGroups",
+        section=_SECTION_SCALABILITY,
         category="Quality Settings",
-        options=[("0", "Low"), ("1", "Medium"), ("2", "High"), ("3", "Epic"), ("4", "Cinematic")],
+        options=(("0", "Low"), ("1", "Medium"), ("2", "High"), ("3", "Epic"), ("4", "Cinematic")),
         default="3",
         performance_impact="Medium"
     ),
@@ -508,9 +576,9 @@ SETTINGS_DEFINITIONS = {
         display_name="Shadow Quality",
         description="Shadow resolution and filtering. 0=512px, 3=4096px shadows.",
         setting_type="choice",
-        section="ScalabilityGroups",
+        section=_SECTION_SCALABILITY,
         category="Quality Settings",
-        options=[("0", "Low"), ("1", "Medium"), ("2", "High"), ("3", "Epic")],
+        options=(("0", "Low"), ("1", "Medium"), ("2", "High"), ("3", "Epic")),
         default="3",
         performance_impact="High"
     ),
@@ -519,9 +587,9 @@ SETTINGS_DEFINITIONS = {
         display_name="Texture Quality",
         description="Texture resolution. Affects VRAM usage more than FPS.",
         setting_type="choice",
-        section="ScalabilityGroups",
+        section=_SECTION_SCALABILITY,
         category="Quality Settings",
-        options=[("0", "Low"), ("1", "Medium"), ("2", "High"), ("3", "Epic")],
+        options=(("0", "Low"), ("1", "Medium"), ("2", "High"), ("3", "Epic")),
         default="3",
         performance_impact="Low"
     ),
@@ -530,9 +598,9 @@ SETTINGS_DEFINITIONS = {
         display_name="Effects Quality",
         description="Particle counts, explosions, physics debris complexity.",
         setting_type="choice",
-        section="ScalabilityGroups",
+        section=_SECTION_SCALABILITY,
         category="Quality Settings",
-        options=[("0", "Low"), ("1", "Medium"), ("2", "High"), ("3", "Epic")],
+        options=(("0", "Low"), ("1", "Medium"), ("2", "High"), ("3", "Epic")),
         default="3",
         performance_impact="Medium"
     ),
@@ -541,9 +609,9 @@ SETTINGS_DEFINITIONS = {
         display_name="Foliage Quality",
         description="Grass/tree density. Low=Sparse vegetation (competitive advantage). Epic=Lush environments.",
         setting_type="choice",
-        section="ScalabilityGroups",
+        section=_SECTION_SCALABILITY,
         category="Quality Settings",
-        options=[("0", "Low"), ("1", "Medium"), ("2", "High"), ("3", "Epic")],
+        options=(("0", "Low"), ("1", "Medium"), ("2", "High"), ("3", "Epic")),
         default="3",
         performance_impact="High"
     ),
@@ -552,9 +620,9 @@ SETTINGS_DEFINITIONS = {
         display_name="Post Processing",
         description="Bloom, lens flares, color grading, depth of field.",
         setting_type="choice",
-        section="ScalabilityGroups",
+        section=_SECTION_SCALABILITY,
         category="Quality Settings",
-        options=[("0", "Low"), ("1", "Medium"), ("2", "High"), ("3", "Epic")],
+        options=(("0", "Low"), ("1", "Medium"), ("2", "High"), ("3", "Epic")),
         default="3",
         performance_impact="Low"
     ),
@@ -563,9 +631,9 @@ SETTINGS_DEFINITIONS = {
         display_name="Reflection Quality",
         description="Screen-space reflections and reflection probe quality.",
         setting_type="choice",
-        section="ScalabilityGroups",
+        section=_SECTION_SCALABILITY,
         category="Quality Settings",
-        options=[("0", "Low"), ("1", "Medium"), ("2", "High"), ("3", "Epic")],
+        options=(("0", "Low"), ("1", "Medium"), ("2", "High"), ("3", "Epic")),
         default="3",
         performance_impact="Medium"
     ),
@@ -574,9 +642,9 @@ SETTINGS_DEFINITIONS = {
         display_name="Shading Quality",
         description="Material complexity, subsurface scattering for skin/hair.",
         setting_type="choice",
-        section="ScalabilityGroups",
+        section=_SECTION_SCALABILITY,
         category="Quality Settings",
-        options=[("0", "Low"), ("1", "Medium"), ("2", "High"), ("3", "Epic")],
+        options=(("0", "Low"), ("1", "Medium"), ("2", "High"), ("3", "Epic")),
         default="3",
         performance_impact="Medium"
     ),
@@ -585,9 +653,9 @@ SETTINGS_DEFINITIONS = {
         display_name="Global Illumination",
         description="Indirect lighting quality (non-RTX fallback).",
         setting_type="choice",
-        section="ScalabilityGroups",
+        section=_SECTION_SCALABILITY,
         category="Quality Settings",
-        options=[("0", "Low"), ("1", "Medium"), ("2", "High"), ("3", "Epic")],
+        options=(("0", "Low"), ("1", "Medium"), ("2", "High"), ("3", "Epic")),
         default="3",
         performance_impact="Medium"
     ),
@@ -596,9 +664,9 @@ SETTINGS_DEFINITIONS = {
         display_name="Anti-Aliasing Quality",
         description="TAA sample count. Often overridden by DLSS/XeSS/FSR.",
         setting_type="choice",
-        section="ScalabilityGroups",
+        section=_SECTION_SCALABILITY,
         category="Quality Settings",
-        options=[("0", "Low"), ("1", "Medium"), ("2", "High"), ("3", "Epic")],
+        options=(("0", "Low"), ("1", "Medium"), ("2", "High"), ("3", "Epic")),
         default="3",
         performance_impact="Low"
     ),
@@ -607,7 +675,7 @@ SETTINGS_DEFINITIONS = {
         display_name="Resolution Scale %",
         description="Internal render resolution percentage. Usually controlled by upscaler.",
         setting_type="slider",
-        section="ScalabilityGroups",
+        section=_SECTION_SCALABILITY,
         category="Quality Settings",
         min_val=25,
         max_val=100,
@@ -629,7 +697,7 @@ SETTINGS_DEFINITIONS = {
         description="⚠️ DISABLE FOR COMPETITIVE PLAY. Mouse smoothing adds interpolation to mouse "
                    "movement, causing input lag and inconsistent aim. Always OFF for best responsiveness.",
         setting_type="boolean",
-        section="/Script/Engine.InputSettings",
+        section=_SECTION_INPUT,
         category="Competitive Settings",
         default=False,
         performance_impact="Low"
@@ -640,7 +708,7 @@ SETTINGS_DEFINITIONS = {
         description="⚠️ DISABLE FOR COMPETITIVE PLAY. Mouse acceleration changes sensitivity based on "
                    "movement speed. Causes inconsistent muscle memory. Always OFF for consistent aim.",
         setting_type="boolean",
-        section="/Script/Engine.InputSettings",
+        section=_SECTION_INPUT,
         category="Competitive Settings",
         default=False,
         performance_impact="Low"
@@ -651,7 +719,7 @@ SETTINGS_DEFINITIONS = {
         description="⚠️ DISABLE FOR COMPETITIVE PLAY. Secondary mouse smoothing setting in engine config. "
                    "Disable both this AND the InputSettings version for best response.",
         setting_type="boolean",
-        section="/Script/Engine.GameUserSettings",
+        section=_SECTION_GAME_USER,
         category="Competitive Settings",
         default=False,
         performance_impact="Low"
@@ -664,9 +732,9 @@ SETTINGS_DEFINITIONS = {
         description="Blurs objects at different distances. 0=OFF (recommended for competitive). "
                    "Higher values add cinematic blur but reduce visibility.",
         setting_type="choice",
-        section="SystemSettings",
+        section=_SECTION_SYSTEM,
         category="Competitive Settings",
-        options=[("0", "Off (Competitive)"), ("1", "Low"), ("2", "High")],
+        options=(("0", "Off (Competitive)"), ("1", "Low"), ("2", "High")),
         default="0",
         performance_impact="Low"
     ),
@@ -676,9 +744,9 @@ SETTINGS_DEFINITIONS = {
         description="Glow effect around bright objects. 0=OFF reduces visual noise and improves "
                    "target visibility. Can be distracting in competitive scenarios.",
         setting_type="choice",
-        section="SystemSettings",
+        section=_SECTION_SYSTEM,
         category="Competitive Settings",
-        options=[("0", "Off (Competitive)"), ("1", "Low"), ("2", "Medium"), ("3", "High"), ("4", "Epic")],
+        options=(("0", "Off (Competitive)"), ("1", "Low"), ("2", "Medium"), ("3", "High"), ("4", "Epic")),
         default="0",
         performance_impact="Low"
     ),
@@ -688,9 +756,9 @@ SETTINGS_DEFINITIONS = {
         description="Simulated camera lens flare from bright lights. 0=OFF recommended for competitive. "
                    "Can obscure enemies near light sources.",
         setting_type="choice",
-        section="SystemSettings",
+        section=_SECTION_SYSTEM,
         category="Competitive Settings",
-        options=[("0", "Off (Competitive)"), ("1", "Low"), ("2", "High")],
+        options=(("0", "Off (Competitive)"), ("1", "Low"), ("2", "High")),
         default="0",
         performance_impact="Low"
     ),
@@ -700,9 +768,9 @@ SETTINGS_DEFINITIONS = {
         description="Color fringing at screen edges simulating camera lens. 0=OFF for cleaner image "
                    "and better edge clarity. Purely cosmetic effect.",
         setting_type="choice",
-        section="SystemSettings",
+        section=_SECTION_SYSTEM,
         category="Competitive Settings",
-        options=[("0", "Off (Competitive)"), ("0.5", "Low"), ("1", "Full")],
+        options=(("0", "Off (Competitive)"), ("0.5", "Low"), ("1", "Full")),
         default="0",
         performance_impact="Low"
     ),
@@ -712,7 +780,7 @@ SETTINGS_DEFINITIONS = {
         description="Post-process sharpening filter. 0=OFF (use upscaler sharpening instead). "
                    "0.5-1.0 adds subtle sharpness. Higher values may cause artifacts.",
         setting_type="slider",
-        section="SystemSettings",
+        section=_SECTION_SYSTEM,
         category="Competitive Settings",
         min_val=0,
         max_val=2,
@@ -725,9 +793,9 @@ SETTINGS_DEFINITIONS = {
         description="Film grain noise effect. 0=OFF for cleaner image. This is different from the "
                    "main film grain setting and controls the quantization of grain.",
         setting_type="choice",
-        section="SystemSettings",
+        section=_SECTION_SYSTEM,
         category="Competitive Settings",
-        options=[("0", "Off (Competitive)"), ("1", "On")],
+        options=(("0", "Off (Competitive)"), ("1", "On")),
         default="0",
         performance_impact="Low"
     ),
@@ -737,9 +805,9 @@ SETTINGS_DEFINITIONS = {
         description="Darkens screen corners for cinematic look. 0=OFF keeps screen edges fully "
                    "visible for better peripheral awareness.",
         setting_type="choice",
-        section="SystemSettings",
+        section=_SECTION_SYSTEM,
         category="Competitive Settings",
-        options=[("0", "Off (Competitive)"), ("1", "On")],
+        options=(("0", "Off (Competitive)"), ("1", "On")),
         default="0",
         performance_impact="Low"
     ),
@@ -751,9 +819,9 @@ SETTINGS_DEFINITIONS = {
         description="⚠️ EXPERIMENTAL. 0=Reduces input lag by 1 frame but may cause stuttering on some "
                    "systems. 1=Default safe mode. Test carefully before using in ranked matches.",
         setting_type="choice",
-        section="SystemSettings",
+        section=_SECTION_SYSTEM,
         category="Competitive Settings",
-        options=[("0", "Off (Lower Latency)"), ("1", "On (Default/Stable)")],
+        options=(("0", "Off (Lower Latency)"), ("1", "On (Default/Stable)")),
         default="1",
         performance_impact="Medium"
     ),
@@ -763,7 +831,7 @@ SETTINGS_DEFINITIONS = {
         description="⚠️ EXPERIMENTAL. Engine frame pacing. False=Disable for potentially lower latency "
                    "but may cause stuttering. True=Smoother but slightly higher latency.",
         setting_type="boolean",
-        section="/Script/Engine.Engine",
+        section=_SECTION_ENGINE,
         category="Competitive Settings",
         default=True,
         performance_impact="Low"
@@ -774,9 +842,9 @@ SETTINGS_DEFINITIONS = {
         description="⚠️ EXPERIMENTAL. 1=Compile shaders during loading (longer loads, less stuttering). "
                    "0=Compile on demand (faster loads, potential stutters). Recommended ON.",
         setting_type="choice",
-        section="SystemSettings",
+        section=_SECTION_SYSTEM,
         category="Competitive Settings",
-        options=[("0", "Off (Faster Load)"), ("1", "On (Less Stutter)")],
+        options=(("0", "Off (Faster Load)"), ("1", "On (Less Stutter)")),
         default="1",
         performance_impact="Low"
     ),
@@ -788,7 +856,7 @@ SETTINGS_DEFINITIONS = {
         description="⚠️ ADVANCED. VRAM budget for texture streaming in megabytes. Higher values reduce "
                    "texture pop-in but use more VRAM. Set based on your GPU: 6GB=4096, 8GB=6144, 12GB+=8192.",
         setting_type="number",
-        section="SystemSettings",
+        section=_SECTION_SYSTEM,
         category="Competitive Settings",
         min_val=1024,
         max_val=16384,
@@ -801,9 +869,9 @@ SETTINGS_DEFINITIONS = {
         description="Texture clarity at angles. 16=Maximum quality (minimal performance impact on modern GPUs). "
                    "Lower values may improve FPS on older hardware.",
         setting_type="choice",
-        section="SystemSettings",
+        section=_SECTION_SYSTEM,
         category="Competitive Settings",
-        options=[("1", "1x (Lowest)"), ("2", "2x"), ("4", "4x"), ("8", "8x"), ("16", "16x (Best)")],
+        options=(("1", "1x (Lowest)"), ("2", "2x"), ("4", "4x"), ("8", "8x"), ("16", "16x (Best)")),
         default="16",
         performance_impact="Low"
     ),
@@ -813,9 +881,9 @@ SETTINGS_DEFINITIONS = {
         description="⚠️ ADVANCED. 1=Enable dynamic texture loading (recommended). 0=Load all textures "
                    "at full res (requires more VRAM, may cause crashes on low VRAM GPUs).",
         setting_type="choice",
-        section="SystemSettings",
+        section=_SECTION_SYSTEM,
         category="Competitive Settings",
-        options=[("0", "Off (All High-Res)"), ("1", "On (Dynamic)")],
+        options=(("0", "Off (All High-Res)"), ("1", "On (Dynamic)")),
         default="1",
         performance_impact="Low"
     ),
@@ -827,9 +895,9 @@ SETTINGS_DEFINITIONS = {
         description="Audio processing quality. Higher values may improve positional audio accuracy "
                    "for footsteps and gunshots. 0=Low, 3=Epic.",
         setting_type="choice",
-        section="/Script/EmbarkUserSettings.EmbarkGameUserSettings",
+        section=_SECTION_EMBARK,
         category="Competitive Settings",
-        options=[("0", "Low"), ("1", "Medium"), ("2", "High"), ("3", "Epic")],
+        options=(("0", "Low"), ("1", "Medium"), ("2", "High"), ("3", "Epic")),
         default="3",
         performance_impact="Low"
     ),
@@ -839,13 +907,85 @@ SETTINGS_DEFINITIONS = {
         description="3D positional audio processing. Enabled=Better directional sound for locating "
                    "enemies. Recommended ON for competitive play.",
         setting_type="boolean",
-        section="/Script/EmbarkUserSettings.EmbarkGameUserSettings",
+        section=_SECTION_EMBARK,
         category="Competitive Settings",
         default=True,
         performance_impact="Low"
     ),
 }
 
+# Column (struct-of-arrays) views of SETTINGS_DEFINITIONS for the ConfigManager
+# hot paths, which only ever need a setting's section and default value.
+_SETTING_KEYS = tuple(SETTINGS_DEFINITIONS)
+_SETTING_INDEX = {key: i for i, key in enumerate(_SETTING_KEYS)}
+_SETTING_SECTIONS = tuple(d.section for d in SETTINGS_DEFINITIONS.values())
+_SETTING_DEFAULTS = tuple(d.default_str for d in SETTINGS_DEFINITIONS.values())
+# Stand-in for a section missing from the config, so lookups don't allocate
+_EMPTY_SECTION: Mapping[str, str] = MappingProxyType({})
+
+
+def _group_by_category(definitions) -> Dict[str, tuple]:
+    """Group setting definitions by category, preserving definition order."""
+    groups: Dict[str, list] = {}
+    for definition in definitions:
+        groups.setdefault(definition.category, []).append(definition)
+    return {category: tuple(defs) for category, defs in groups.items()}
+
+
+# Settings grouped by category, built once for the GUI tab builders
+_SETTINGS_BY_CATEGORY = _group_by_category(SETTINGS_DEFINITIONS.values())
+
+# Competitive settings are opt-in: only changed when already in the config,
+# and otherwise added explicitly from the Competitive Settings tab
+_COMPETITIVE_KEYS = frozenset(d.key for d in _SETTINGS_BY_CATEGORY.get("Competitive Settings", ()))
+
+
+def get_settings_for_category(category: str) -> tuple:
+    """Return the setting definitions for a category, in definition order."""
+    return _SETTINGS_BY_CATEGORY.get(category, ())
+
+
+def _choice_validator(definition: SettingDefinition) -> Callable[[str], bool]:
+    allowed = frozenset(opt[0] for opt in definition.options)
+    return allowed.__contains__
+
+
+def _boolean_validator(definition: SettingDefinition) -> Callable[[str], bool]:
+    return lambda value: value.lower() in ('true', 'false')
+
+
+def _number_validator(definition: SettingDefinition) -> Callable[[str], bool]:
+    min_val, max_val = definition.min_val, definition.max_val
+
+    def validate(value: str) -> bool:
+        try:
+            number = float(value)
+        except ValueError:
+            return False
+        return min_val <= number <= max_val
+
+    return validate
+
+
+# Validator factories keyed by setting_type; each returns a check specialized
+# to one definition's options/range
+_VALIDATORS = {
+    'choice': _choice_validator,
+    'boolean': _boolean_validator,
+    'number': _number_validator,
+    'slider': _number_validator,
+}
+
+# Per-setting validators, aligned with _SETTING_KEYS and built once at import
+_SETTING_VALIDATORS = tuple(_VALIDATORS[d.setting_type](d) for d in SETTINGS_DEFINITIONS.values())
+
+
+def validate_setting_value(key: str, value: str) -> bool:
+    """Check that a stored (INI) value is valid for a setting (False for unknown keys)."""
+    idx = _SETTING_INDEX.get(key)
+    return idx is not None and _SETTING_VALIDATORS[idx](value)
+
+
 # Preset configurations
 PRESETS = {
     "Competitive": {
@@ -940,17 +1080,220 @@ PRESETS = {
 }
 
 
+def _freeze_presets(presets: Dict[str, Dict[str, Any]]) -> MappingProxyType:
+    """Return a read-only view of the presets with values canonicalized to INI strings."""
+    frozen = {}
+    for name, preset in presets.items():
+        settings = {key: str(value) for key, value in preset['settings'].items()}
+        frozen[name] = MappingProxyType({
+            'description': preset['description'],
+            'settings': MappingProxyType(settings),
+        })
+    return MappingProxyType(frozen)
+
+
+PRESETS = _freeze_presets(PRESETS)
+
+# Presets flattened to parallel (sections, keys, values) tuples for bulk apply
+_PRESET_ARRAYS = {
+    name: (
+        tuple(_SETTING_SECTIONS[_SETTING_INDEX[key]] for key in preset['settings']),
+        tuple(preset['settings']),
+        tuple(preset['settings'].values()),
+    )
+    for name, preset in PRESETS.items()
+}
+
+
+# =============================================================================
+# INI PARSING
+# =============================================================================
+
+def parse_ini(text: str) -> Dict[str, Dict[str, str]]:
+    """
+    Parse Unreal Engine INI content into a {section: {key: value}} dict.
+
+    configparser is not used because it also treats ':' as a key delimiter,
+    drops ';' and '#' comment lines (commented-out key=value lines survive a
+    round trip here), lowercases keys and interpolates values. Lines before
+    the first section header and lines without '=' are ignored; a repeated
+    key keeps its last value.
+    """
+    config: Dict[str, Dict[str, str]] = {}
+    current = None
+
+    for line in text.splitlines():
+        line = line.strip()
+        if not line:
+            continue
+
+        # Section header
+        if line[0] == '[' and line[-1] == ']':
+            # Interned so lookups with the _SECTION_* constants match by identity
+            current = config.setdefault(sys.intern(line[1:-1]), {})
+            continue
+
+        # Key=Value pair
+        if current is not None:
+            key, sep, value = line.partition('=')
+            if sep:
+                current[key.strip()] = value.strip()
+
+    return config
+
+
+def dump_ini(config: Dict[str, Dict[str, str]]) -> str:
+    """Serialize a {section: {key: value}} dict to Unreal Engine INI content."""
+    lines = []
+    for section, values in config.items():
+        lines.append(f"[{section}]\n")
+        lines.extend([f"{key}={value}\n" for key, value in values.items()])
+        lines.append("\n")
+    return "".join(lines)
+
+
+@lru_cache(maxsize=8)
+def _parse_ini_file(path: str, mtime_ns: int, size: int, inode: int) -> Dict[str, Dict[str, str]]:
+    """
+    Parse an INI file from disk.
+
+    Cached on the file's stat signature, so reloading an unchanged file skips
+    the read and parse. Callers must copy the result before mutating it.
+    """
+    # utf-8-sig strips the BOM Unreal may write, which would otherwise hide the
+    # first section header
+    with open(path, 'r', encoding='utf-8-sig') as f:
+        return parse_ini(f.read())
+
+
 # =============================================================================
 # CONFIG MANAGER
 # =============================================================================
 
+def _scan_files(directory: Path, prefix: str, suffix: str) -> List[os.DirEntry]:
+    """
+    List files in a directory whose names match a prefix and suffix.
+
+    Uses a single os.scandir() pass; the returned DirEntry objects cache their
+    stat results (for free on Windows), avoiding a separate stat per file.
+    Returns an empty list if the directory does not exist.
+    """
+    try:
+        with os.scandir(directory) as entries:
+            return [entry for entry in entries
+                    if entry.name.startswith(prefix) and entry.name.endswith(suffix)
+                    and entry.is_file()]
+    except FileNotFoundError:
+        return []
+
+
+def _json_dumps(obj: Any) -> bytes:
+    """Serialize to indented UTF-8 JSON, using orjson when available."""
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2)
+    return json.dumps(obj, indent=2).encode('utf-8')
+
+
+def _json_loads(data: bytes) -> Any:
+    """Deserialize UTF-8 JSON, using orjson when available."""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+# System directories that config, backup and profile paths must never point into
+if IS_WINDOWS:
+    _FORBIDDEN_PATHS = (
+        Path("C:/Windows"),
+        Path("C:/Program Files"),
+        Path("C:/Program Files (x86)"),
+    )
+elif IS_LINUX:
+    _FORBIDDEN_PATHS = (
+        Path("/etc"),
+        Path("/usr"),
+        Path("/bin"),
+        Path("/sbin"),
+        Path("/boot"),
+        Path("/sys"),
+        Path("/proc"),
+        Path("/dev"),
+        Path("/root"),
+    )
+else:
+    _FORBIDDEN_PATHS = ()
+
+
+@lru_cache(maxsize=None)
+def _resolved_forbidden_paths() -> tuple:
+    """Resolve the existing forbidden directories once, on first validation."""
+    return tuple(p.resolve() for p in _FORBIDDEN_PATHS if p.exists())
+
+
+# File extensions validate_path accepts (config, profile, extensionless)
+_ALLOWED_SUFFIXES = frozenset({'.ini', '.json', ''})
+
+
+@lru_cache(maxsize=128)
+def _read_profile_file(path: str, mtime_ns: int, size: int, inode: int) -> Dict[str, Any]:
+    """
+    Read and decode a profile file.
+
+    Cached on the file's stat signature like _parse_ini_file, so listing and
+    loading profiles only re-parses files that changed. Callers must copy the
+    result before mutating it.
+    """
+    return _json_loads(Path(path).read_bytes())
+
+
+# Characters not allowed in profile file names
+_UNSAFE_PROFILE_CHARS = re.compile(r'[^\w\-]')
+
+
+def _atomic_copy(src: Path, dst: Path) -> None:
+    """
+    Copy src to dst through a temp file so dst is never left half-written.
+
+    An existing dst keeps its permissions (e.g. read-only), as it would if
+    copied over in place.
+    """
+    tmp_path = dst.with_name(f".{dst.name}.tmp")
+    try:
+        shutil.copyfile(src, tmp_path)
+        if dst.exists():
+            shutil.copymode(dst, tmp_path)
+        os.replace(tmp_path, dst)
+    except BaseException:
+        tmp_path.unlink(missing_ok=True)
+        raise
+
+
+def _atomic_write_text(path: Path, text: str) -> None:
+    """
+    Write text to path through a temp file so path is never left half-written.
+
+    An existing path keeps its permissions (e.g. read-only, which some users
+    set to stop the game overwriting their tweaks).
+    """
+    tmp_path = path.with_name(f".{path.name}.tmp")
+    try:
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            f.write(text)
+            f.flush()
+            os.fsync(f.fileno())
+        if path.exists():
+            shutil.copymode(path, tmp_path)
+        os.replace(tmp_path, path)
+    except BaseException:
+        tmp_path.unlink(missing_ok=True)
+        raise
+
+
 class ConfigManager:
     """Handles reading, writing, and backing up Arc Raiders configuration files."""
 
-    # Default config path - Arc Raiders (PioneerGame) UE5 location
-    # Automatically determined based on platform (Windows/Linux/SteamOS)
-    DEFAULT_CONFIG_PATH = get_default_config_path()
-    
+    __slots__ = ('config_path', 'backup_dir', 'profiles_dir', 'current_config')
+
     def __init__(self):
         self.config_path: Optional[Path] = None
         self.backup_dir: Optional[Path] = None
@@ -962,7 +1305,10 @@ class ConfigManager:
         if config_path:
             self.config_path = Path(config_path)
         else:
-            self.config_path = self.DEFAULT_CONFIG_PATH
+            # Default config path - Arc Raiders (PioneerGame) UE5 location.
+            # Resolved here rather than at import since on Linux it searches
+            # the Steam libraries for the Proton prefix.
+            self.config_path = get_default_config_path()
 
         if not self.config_path:
             logger.error("Could not determine default config path. Please manually locate the config file.")
@@ -989,38 +1335,16 @@ class ConfigManager:
             resolved = path.resolve()
 
             # Check it's not trying to escape to system directories
-            forbidden_paths = []
-
-            if IS_WINDOWS:
-                forbidden_paths = [
-                    Path("C:/Windows"),
-                    Path("C:/Program Files"),
-                    Path("C:/Program Files (x86)"),
-                ]
-            elif IS_LINUX:
-                forbidden_paths = [
-                    Path("/etc"),
-                    Path("/usr"),
-                    Path("/bin"),
-                    Path("/sbin"),
-                    Path("/boot"),
-                    Path("/sys"),
-                    Path("/proc"),
-                    Path("/dev"),
-                    Path("/root"),
-                ]
-
-            for forbidden in forbidden_paths:
-                if forbidden.exists():
-                    try:
-                        resolved.relative_to(forbidden.resolve())
-                        logger.error(f"Attempted access to forbidden path: {path}")
-                        return False
-                    except ValueError:
-                        pass  # Not a subpath, which is good
+            for forbidden in _resolved_forbidden_paths():
+                try:
+                    resolved.relative_to(forbidden)
+                    logger.error(f"Attempted access to forbidden path: {path}")
+                    return False
+                except ValueError:
+                    pass  # Not a subpath, which is good
 
             # Must have .ini extension for config files
-            if path.suffix.lower() not in ['.ini', '.json', '']:
+            if path.suffix.lower() not in _ALLOWED_SUFFIXES:
                 logger.error(f"Invalid file extension: {path}")
                 return False
 
@@ -1031,32 +1355,18 @@ class ConfigManager:
     
     def read_config(self) -> Dict[str, Dict[str, str]]:
         """Read the configuration file."""
-        if not self.config_path or not self.config_path.exists():
+        if not self.config_path:
             raise FileNotFoundError("Config file not found")
-            
-        config = {}
-        current_section = None
-        
-        with open(self.config_path, 'r', encoding='utf-8') as f:
-            for line in f:
-                line = line.strip()
-                
-                # Skip empty lines
-                if not line:
-                    continue
-                    
-                # Section header
-                if line.startswith('[') and line.endswith(']'):
-                    current_section = line[1:-1]
-                    if current_section not in config:
-                        config[current_section] = {}
-                    continue
-                    
-                # Key=Value pair
-                if '=' in line and current_section:
-                    key, _, value = line.partition('=')
-                    config[current_section][key.strip()] = value.strip()
-                    
+
+        try:
+            stat = self.config_path.stat()
+        except FileNotFoundError:
+            raise FileNotFoundError("Config file not found") from None
+
+        parsed = _parse_ini_file(str(self.config_path), stat.st_mtime_ns, stat.st_size, stat.st_ino)
+        # Copy so edits to current_config never leak into the cached parse
+        config = {section: dict(values) for section, values in parsed.items()}
+
         self.current_config = config
         return config
     
@@ -1069,13 +1379,8 @@ class ConfigManager:
             raise ValueError("Invalid config path")
             
         try:
-            with open(self.config_path, 'w', encoding='utf-8') as f:
-                for section, values in config.items():
-                    f.write(f"[{section}]\n")
-                    for key, value in values.items():
-                        f.write(f"{key}={value}\n")
-                    f.write("\n")
-                    
+            _atomic_write_text(self.config_path, dump_ini(config))
+
             self.current_config = config
             return True
         except Exception as e:
@@ -1090,13 +1395,13 @@ class ConfigManager:
         if not self.backup_dir:
             return None
             
-        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+        timestamp = time.strftime("%Y%m%d_%H%M%S")
         tag_suffix = f"_{tag}" if tag else ""
         backup_name = f"GameUserSettings_{timestamp}{tag_suffix}.ini"
         backup_path = self.backup_dir / backup_name
         
         try:
-            shutil.copy2(self.config_path, backup_path)
+            _atomic_copy(self.config_path, backup_path)
             logger.info(f"Backup created: {backup_path}")
             return backup_path
         except Exception as e:
@@ -1105,20 +1410,22 @@ class ConfigManager:
     
     def list_backups(self) -> list:
         """List available backup files."""
-        if not self.backup_dir or not self.backup_dir.exists():
+        if not self.backup_dir:
             return []
-            
+
         backups = []
-        for f in self.backup_dir.glob("GameUserSettings_*.ini"):
-            stat = f.stat()
+        for entry in _scan_files(self.backup_dir, "GameUserSettings_", ".ini"):
+            stat = entry.stat()
             backups.append({
-                'path': f,
-                'name': f.name,
+                'path': Path(entry.path),
+                'name': entry.name,
                 'date': datetime.fromtimestamp(stat.st_mtime),
+                'mtime_ns': stat.st_mtime_ns,
                 'size': stat.st_size
             })
-            
-        return sorted(backups, key=lambda x: x['date'], reverse=True)
+
+        # Sort on the integer timestamp, which compares cheaper than datetimes
+        return sorted(backups, key=itemgetter('mtime_ns'), reverse=True)
     
     def restore_backup(self, backup_path: Path) -> bool:
         """Restore a backup file."""
@@ -1132,21 +1439,23 @@ class ConfigManager:
         self.create_backup("pre_restore")
         
         try:
-            shutil.copy2(backup_path, self.config_path)
+            _atomic_copy(backup_path, self.config_path)
             logger.info(f"Restored backup: {backup_path}")
             return True
         except Exception as e:
             logger.error(f"Restore failed: {e}")
             return False
     
+    def _profile_path(self, name: str) -> Path:
+        """Return the JSON file path for a profile, with the name sanitized."""
+        return self.profiles_dir / f"{_UNSAFE_PROFILE_CHARS.sub('_', name)}.json"
+
     def save_profile(self, name: str, config: Dict[str, Dict[str, str]]) -> bool:
         """Save current settings as a named profile."""
         if not self.profiles_dir:
             return False
             
-        # Sanitize profile name
-        safe_name = re.sub(r'[^\w\-]', '_', name)
-        profile_path = self.profiles_dir / f"{safe_name}.json"
+        profile_path = self._profile_path(name)
         
         if not self.validate_path(profile_path):
             return False
@@ -1157,8 +1466,10 @@ class ConfigManager:
                 'created': datetime.now().isoformat(),
                 'config': config
             }
-            with open(profile_path, 'w', encoding='utf-8') as f:
-                json.dump(profile_data, f, indent=2)
+            profile_path.write_bytes(_json_dumps(profile_data))
+            # A same-size rewrite within the filesystem's mtime granularity
+            # (2s on FAT/exFAT) keeps the same stat signature
+            _read_profile_file.cache_clear()
             logger.info(f"Profile saved: {name}")
             return True
         except Exception as e:
@@ -1170,16 +1481,20 @@ class ConfigManager:
         if not self.profiles_dir:
             return None
             
-        safe_name = re.sub(r'[^\w\-]', '_', name)
-        profile_path = self.profiles_dir / f"{safe_name}.json"
-        
-        if not profile_path.exists():
+        profile_path = self._profile_path(name)
+
+        try:
+            stat = profile_path.stat()
+        except FileNotFoundError:
             return None
             
         try:
-            with open(profile_path, 'r', encoding='utf-8') as f:
-                data = json.load(f)
-            return data.get('config')
+            data = _read_profile_file(str(profile_path), stat.st_mtime_ns, stat.st_size, stat.st_ino)
+            config = data.get('config')
+            if config is None:
+                return None
+            # Copy so edits to the loaded config never leak into the cached parse
+            return {section: dict(values) for section, values in config.items()}
         except Exception as e:
             logger.error(f"Failed to load profile: {e}")
             return None
@@ -1190,15 +1505,16 @@ class ConfigManager:
             return []
             
         profiles = []
-        for f in self.profiles_dir.glob("*.json"):
+        for entry in _scan_files(self.profiles_dir, "", ".json"):
+            f = Path(entry.path)
             try:
-                with open(f, 'r', encoding='utf-8') as file:
-                    data = json.load(file)
-                    profiles.append({
-                        'path': f,
-                        'name': data.get('name', f.stem),
-                        'created': data.get('created', 'Unknown')
-                    })
+                stat = entry.stat()
+                data = _read_profile_file(entry.path, stat.st_mtime_ns, stat.st_size, stat.st_ino)
+                profiles.append({
+                    'path': f,
+                    'name': data.get('name', f.stem),
+                    'created': data.get('created', 'Unknown')
+                })
             except Exception:
                 pass
                 
@@ -1209,42 +1525,77 @@ class ConfigManager:
         if not self.profiles_dir:
             return False
             
-        safe_name = re.sub(r'[^\w\-]', '_', name)
-        profile_path = self.profiles_dir / f"{safe_name}.json"
+        profile_path = self._profile_path(name)
         
         if profile_path.exists():
             try:
                 profile_path.unlink()
+                _read_profile_file.cache_clear()
                 return True
             except Exception as e:
                 logger.error(f"Failed to delete profile: {e}")
                 
         return False
     
+    def apply_preset(self, name: str) -> bool:
+        """
+        Apply a preset's values to the current config (does not write the file).
+
+        Like the GUI, competitive settings are only changed when already in
+        the config.
+        """
+        arrays = _PRESET_ARRAYS.get(name)
+        if not arrays:
+            return False
+
+        config = self.current_config
+        for section, key, value in zip(*arrays):
+            if key in _COMPETITIVE_KEYS and key not in config.get(section, _EMPTY_SECTION):
+                continue
+            if section not in config:
+                config[section] = {}
+            config[section][key] = value
+        return True
+
     def get_setting(self, key: str) -> Optional[str]:
         """Get a setting value from current config."""
-        definition = SETTINGS_DEFINITIONS.get(key)
-        if not definition:
+        idx = _SETTING_INDEX.get(key)
+        if idx is None:
             return None
-            
-        section_config = self.current_config.get(definition.section, {})
-        
-        # Handle sg. prefix for scalability groups
-        if key.startswith("sg."):
-            return section_config.get(key, str(definition.default))
-        else:
-            return section_config.get(key, str(definition.default))
-    
+
+        section_config = self.current_config.get(_SETTING_SECTIONS[idx], _EMPTY_SECTION)
+        return section_config.get(key, _SETTING_DEFAULTS[idx])
+
+    def accepts_setting(self, key: str, value: str) -> bool:
+        """
+        Check whether set_setting would store value for a setting.
+
+        A value already in the config is always accepted, as the game writes
+        values outside the known options and ranges; anything else must be
+        valid for the setting.
+        """
+        idx = _SETTING_INDEX.get(key)
+        if idx is None:
+            return False
+
+        section_config = self.current_config.get(_SETTING_SECTIONS[idx], _EMPTY_SECTION)
+        return value == section_config.get(key) or _SETTING_VALIDATORS[idx](value)
+
     def set_setting(self, key: str, value: str) -> bool:
         """Set a setting value in current config."""
-        definition = SETTINGS_DEFINITIONS.get(key)
-        if not definition:
+        idx = _SETTING_INDEX.get(key)
+        if idx is None:
             return False
-            
-        if definition.section not in self.current_config:
-            self.current_config[definition.section] = {}
-            
-        self.current_config[definition.section][key] = value
+
+        if not self.accepts_setting(key, value):
+            logger.warning(f"Rejected invalid value for {key}: {value!r}")
+            return False
+
+        section = _SETTING_SECTIONS[idx]
+        if section not in self.current_config:
+            self.current_config[section] = {}
+
+        self.current_config[section][key] = value
         return True
 
 
@@ -1252,10 +1603,89 @@ class ConfigManager:
 # GUI APPLICATION
 # =============================================================================
 
+# ttk label style and text for each SettingDefinition.performance_impact
+_IMPACT_LABELS = {
+    impact: (f'Impact.{impact.replace(" ", "")}.TLabel', f" [{impact} Impact]")
+    for impact in ("Low", "Medium", "High", "Very High")
+}
+
+
+def _choice_to_var(var, definition: SettingDefinition, value: str):
+    var.set(definition.reverse_map.get(value, value))
+
+
+def _choice_from_var(var, definition: SettingDefinition) -> str:
+    display_value = var.get()
+    return definition.value_map.get(display_value, display_value)
+
+
+def _boolean_to_var(var, definition: SettingDefinition, value: str):
+    var.set(value.lower() == 'true')
+
+
+def _boolean_from_var(var, definition: SettingDefinition) -> str:
+    return "True" if var.get() else "False"
+
+
+def _number_to_var(var, definition: SettingDefinition, value: str):
+    var.set(value)
+
+
+def _slider_to_var(var, definition: SettingDefinition, value: str):
+    var.set(int(float(value)))
+
+
+def _number_from_var(var, definition: SettingDefinition) -> str:
+    return str(var.get())
+
+
+# (to_var, from_var) keyed by setting_type: convert a stored INI value to
+# the widget variable's value and back
+_VAR_CONVERTERS = {
+    'choice': (_choice_to_var, _choice_from_var),
+    'boolean': (_boolean_to_var, _boolean_from_var),
+    'number': (_number_to_var, _number_from_var),
+    'slider': (_slider_to_var, _number_from_var),
+}
+
+
 class ArcTunerApp:
     """Main application window."""
-    
+
+    # Arc Raiders color palette
+    colors = {
+        'bg_dark': '#1a1a1a',       # Main background
+        'bg_medium': '#2d2d2d',      # Panel background
+        'bg_light': '#3d3d3d',       # Lighter elements
+        'bg_hover': '#4a4a4a',       # Hover state
+        'accent': '#ff6b00',         # Orange accent (Arc Raiders brand)
+        'accent_hover': '#ff8c00',   # Lighter orange
+        'accent_dim': '#cc5500',     # Darker orange
+        'text': '#e0e0e0',           # Primary text
+        'text_dim': '#999999',       # Secondary text
+        'text_dark': '#666666',      # Disabled text
+        'border': '#404040',         # Border color
+        'success': '#4caf50',        # Green for success
+        'warning': '#ff9800',        # Warning orange
+        'error': '#f44336',          # Error red
+        'cyan': '#00b4d8',           # Cyan accent for highlights
+    }
+
+    # Named Tk fonts, registered once per window in _create_styles and shared
+    # by every style and widget that uses them
+    fonts = {
+        'ArcTinyBold': ('Segoe UI', 8, 'bold'),
+        'ArcSmall': ('Segoe UI', 9, 'normal'),
+        'ArcSmallBold': ('Segoe UI', 9, 'bold'),
+        'ArcBody': ('Segoe UI', 10, 'normal'),
+        'ArcBodyBold': ('Segoe UI', 10, 'bold'),
+        'ArcHeader': ('Segoe UI', 12, 'bold'),
+        'ArcSubtitle': ('Segoe UI', 14, 'normal'),
+        'ArcTitle': ('Segoe UI', 14, 'bold'),
+    }
+
     def __init__(self):
+        _import_tkinter()
         self.root = tk.Tk()
         self.root.title("ARC RAIDERS // CONFIG TUNER")
         self.root.geometry("1050x750")
@@ -1271,6 +1701,19 @@ class ArcTunerApp:
         self.config_manager = ConfigManager()
         self.setting_widgets: Dict[str, Any] = {}
         self.unsaved_changes = False
+        self._changes_label_job = None
+        # Status bar text, and the pending job that restores it after a
+        # _flash_status message
+        self._status_text = "No config loaded"
+        self._status_flash_job = None
+
+        # One Tcl command handles the write traces of every setting variable,
+        # mapping the traced variable's name back to its setting key
+        self._var_keys: Dict[str, str] = {}
+        self._var_trace_cmd = self.root.register(self._on_var_write)
+        # Set during bulk widget updates, which flag unsaved changes themselves
+        # (or, for loads, aren't changes at all)
+        self._loading_widgets = False
         
         self._create_styles()
         self._create_menu()
@@ -1284,24 +1727,12 @@ class ArcTunerApp:
         """Configure ttk styles with Arc Raiders dark theme."""
         style = ttk.Style()
 
-        # Arc Raiders color palette
-        self.colors = {
-            'bg_dark': '#1a1a1a',       # Main background
-            'bg_medium': '#2d2d2d',      # Panel background
-            'bg_light': '#3d3d3d',       # Lighter elements
-            'bg_hover': '#4a4a4a',       # Hover state
-            'accent': '#ff6b00',         # Orange accent (Arc Raiders brand)
-            'accent_hover': '#ff8c00',   # Lighter orange
-            'accent_dim': '#cc5500',     # Darker orange
-            'text': '#e0e0e0',           # Primary text
-            'text_dim': '#999999',       # Secondary text
-            'text_dark': '#666666',      # Disabled text
-            'border': '#404040',         # Border color
-            'success': '#4caf50',        # Green for success
-            'warning': '#ff9800',        # Warning orange
-            'error': '#f44336',          # Error red
-            'cyan': '#00b4d8',           # Cyan accent for highlights
-        }
+        # Keep the Font objects referenced; Tk deletes a named font when the
+        # object that created it is garbage collected
+        self._named_fonts = [
+            tkfont.Font(self.root, name=name, family=family, size=size, weight=weight)
+            for name, (family, size, weight) in self.fonts.items()
+        ]
 
         # Use clam as base theme (most customizable)
         style.theme_use('clam')
@@ -1317,20 +1748,20 @@ class ArcTunerApp:
         style.configure('TLabel',
                        background=self.colors['bg_dark'],
                        foreground=self.colors['text'],
-                       font=('Segoe UI', 10))
+                       font='ArcBody')
 
         style.configure('Header.TLabel',
-                       font=('Segoe UI', 12, 'bold'),
+                       font='ArcHeader',
                        foreground=self.colors['text'],
                        background=self.colors['bg_medium'])
 
         style.configure('Title.TLabel',
-                       font=('Segoe UI', 14, 'bold'),
+                       font='ArcTitle',
                        foreground=self.colors['accent'],
                        background=self.colors['bg_dark'])
 
         style.configure('Description.TLabel',
-                       font=('Segoe UI', 9),
+                       font='ArcSmall',
                        foreground=self.colors['text_dim'],
                        background=self.colors['bg_medium'])
 
@@ -1338,25 +1769,25 @@ class ArcTunerApp:
         style.configure('Impact.Low.TLabel',
                        foreground=self.colors['success'],
                        background=self.colors['bg_medium'],
-                       font=('Segoe UI', 9))
+                       font='ArcSmall')
         style.configure('Impact.Medium.TLabel',
                        foreground=self.colors['warning'],
                        background=self.colors['bg_medium'],
-                       font=('Segoe UI', 9))
+                       font='ArcSmall')
         style.configure('Impact.High.TLabel',
                        foreground='#ff6b6b',
                        background=self.colors['bg_medium'],
-                       font=('Segoe UI', 9))
+                       font='ArcSmall')
         style.configure('Impact.VeryHigh.TLabel',
                        foreground=self.colors['error'],
                        background=self.colors['bg_medium'],
-                       font=('Segoe UI', 9, 'bold'))
+                       font='ArcSmallBold')
 
         # Status labels
         style.configure('Status.TLabel',
                        background=self.colors['bg_dark'],
                        foreground=self.colors['text_dim'],
-                       font=('Segoe UI', 9))
+                       font='ArcSmall')
 
         # === Notebook (Tab) Styles ===
         style.configure('TNotebook',
@@ -1368,7 +1799,7 @@ class ArcTunerApp:
                        background=self.colors['bg_light'],
                        foreground=self.colors['text_dim'],
                        padding=[16, 8],
-                       font=('Segoe UI', 10, 'bold'),
+                       font='ArcBodyBold',
                        borderwidth=0)
 
         style.map('TNotebook.Tab',
@@ -1383,7 +1814,7 @@ class ArcTunerApp:
                        background=self.colors['bg_light'],
                        foreground=self.colors['text'],
                        padding=[12, 6],
-                       font=('Segoe UI', 10),
+                       font='ArcBody',
                        borderwidth=1)
 
         style.map('TButton',
@@ -1396,7 +1827,7 @@ class ArcTunerApp:
                        background=self.colors['accent'],
                        foreground='#ffffff',
                        padding=[16, 8],
-                       font=('Segoe UI', 10, 'bold'))
+                       font='ArcBodyBold')
 
         style.map('Accent.TButton',
                  background=[('active', self.colors['accent_hover']),
@@ -1407,7 +1838,7 @@ class ArcTunerApp:
                        background=self.colors['success'],
                        foreground='#ffffff',
                        padding=[8, 4],
-                       font=('Segoe UI', 9, 'bold'))
+                       font='ArcSmallBold')
 
         style.map('Add.TButton',
                  background=[('active', '#5cbf60'),
@@ -1418,7 +1849,7 @@ class ArcTunerApp:
                        background=self.colors['error'],
                        foreground='#ffffff',
                        padding=[8, 4],
-                       font=('Segoe UI', 9, 'bold'))
+                       font='ArcSmallBold')
 
         style.map('Remove.TButton',
                  background=[('active', '#ff5252'),
@@ -1429,22 +1860,22 @@ class ArcTunerApp:
         style.configure('Warning.TLabel',
                        background='#3d3520',
                        foreground=self.colors['warning'],
-                       font=('Segoe UI', 10))
+                       font='ArcBody')
 
         # Not Added style (dimmed card)
         style.configure('NotAdded.TFrame', background='#252525')
         style.configure('NotAdded.TLabel',
                        background='#252525',
                        foreground=self.colors['text_dim'],
-                       font=('Segoe UI', 10))
+                       font='ArcBody')
         style.configure('NotAddedHeader.TLabel',
                        background='#252525',
                        foreground=self.colors['text_dim'],
-                       font=('Segoe UI', 12, 'bold'))
+                       font='ArcHeader')
         style.configure('NotAddedDesc.TLabel',
                        background='#252525',
                        foreground=self.colors['text_dark'],
-                       font=('Segoe UI', 9))
+                       font='ArcSmall')
 
         # === Combobox Styles ===
         style.configure('TCombobox',
@@ -1464,7 +1895,7 @@ class ArcTunerApp:
         style.configure('TCheckbutton',
                        background=self.colors['bg_medium'],
                        foreground=self.colors['text'],
-                       font=('Segoe UI', 10))
+                       font='ArcBody')
 
         style.map('TCheckbutton',
                  background=[('active', self.colors['bg_medium'])],
@@ -1544,7 +1975,7 @@ class ArcTunerApp:
         for preset_name, preset_data in PRESETS.items():
             preset_menu.add_command(
                 label=f"{preset_name} - {preset_data['description']}",
-                command=lambda n=preset_name: self._apply_preset(n)
+                command=partial(self._apply_preset, preset_name)
             )
 
         # Help menu
@@ -1567,7 +1998,7 @@ class ArcTunerApp:
         title_label.pack(side=tk.LEFT)
 
         subtitle_label = ttk.Label(header_frame, text="  CONFIG TUNER",
-                                  font=('Segoe UI', 14), foreground=self.colors['text_dim'])
+                                  font='ArcSubtitle', foreground=self.colors['text_dim'])
         subtitle_label.pack(side=tk.LEFT)
 
         # Status indicator on the right
@@ -1578,7 +2009,7 @@ class ArcTunerApp:
         self.status_frame = ttk.Frame(main_frame)
         self.status_frame.pack(fill=tk.X, pady=(0, 10))
 
-        self.status_label = ttk.Label(self.status_frame, text="No config loaded",
+        self.status_label = ttk.Label(self.status_frame, text=self._status_text,
                                      style='Status.TLabel')
         self.status_label.pack(side=tk.LEFT)
 
@@ -1586,12 +2017,8 @@ class ArcTunerApp:
         self.notebook = ttk.Notebook(main_frame)
         self.notebook.pack(fill=tk.BOTH, expand=True, pady=(5, 10))
 
-        # Create tabs by category
-        categories = {}
-        for key, definition in SETTINGS_DEFINITIONS.items():
-            if definition.category not in categories:
-                categories[definition.category] = []
-            categories[definition.category].append(definition)
+        # Tab canvases scrolled by the mouse wheel (see _on_mousewheel)
+        self._scroll_canvases = set()
 
         # Store reference to competitive settings for dynamic updates
         self.competitive_settings_definitions = []
@@ -1599,13 +2026,22 @@ class ArcTunerApp:
         self.competitive_scrollable_frame = None
         self.competitive_canvas = None
 
-        for category, settings in categories.items():
+        # Tabs other than the first are only filled in when first selected;
+        # until then their settings are read from and written to the config
+        # directly. Builders keyed by notebook tab id.
+        self._pending_tabs: Dict[str, Callable[[], None]] = {}
+        self._unbuilt_settings: Dict[str, SettingDefinition] = {}
+
+        # Create tabs by category
+        for index, (category, settings) in enumerate(_SETTINGS_BY_CATEGORY.items()):
             if category == "Competitive Settings":
                 # Store definitions for later and create special tab
                 self.competitive_settings_definitions = settings
                 self._create_competitive_settings_tab(category, settings)
             else:
-                self._create_category_tab(category, settings)
+                self._create_category_tab(category, settings, lazy=index > 0)
+
+        self.notebook.bind("<<NotebookTabChanged>>", self._on_tab_changed)
 
         # === Bottom Button Bar ===
         button_frame = ttk.Frame(main_frame)
@@ -1619,22 +2055,65 @@ class ArcTunerApp:
         ttk.Button(button_frame, text="Reload", command=self._reload_config).pack(side=tk.RIGHT, padx=5)
         ttk.Button(button_frame, text="Reset to Defaults", command=self._reset_to_defaults).pack(side=tk.RIGHT, padx=5)
         
-    def _create_category_tab(self, category: str, settings: list):
+    def _create_category_tab(self, category: str, settings: list, lazy: bool = False):
         """Create a tab for a settings category with dark theme."""
         # Create scrollable frame
         tab_frame = ttk.Frame(self.notebook)
         self.notebook.add(tab_frame, text=f"  {category}  ")  # Add padding to tab text
 
+        if lazy:
+            self._pending_tabs[str(tab_frame)] = lambda: self._fill_lazy_category_tab(tab_frame, settings)
+            for definition in settings:
+                self._unbuilt_settings[definition.key] = definition
+        else:
+            self._fill_category_tab(tab_frame, settings)
+
+    def _bind_scrollregion(self, frame: ttk.Frame, canvas: tk.Canvas):
+        """Keep canvas's scrollregion fitted to frame, recomputing it at most once per idle."""
+        pending = False
+
+        def update():
+            nonlocal pending
+            pending = False
+            canvas.configure(scrollregion=canvas.bbox("all"))
+
+        def schedule(event):
+            # Packing a tab's cards resizes the frame repeatedly; measure once
+            # after the layout settles instead of on every step
+            nonlocal pending
+            if not pending:
+                pending = True
+                canvas.after_idle(update)
+
+        frame.bind("<Configure>", schedule)
+
+    def _on_tab_changed(self, event=None):
+        """Fill in a lazily created tab the first time it is selected."""
+        build = self._pending_tabs.pop(self.notebook.select(), None)
+        if build:
+            build()
+
+    def _fill_lazy_category_tab(self, tab_frame: ttk.Frame, settings: list):
+        """Fill in a category tab that was created empty."""
+        self._fill_category_tab(tab_frame, settings)
+
+        keys = []
+        for definition in settings:
+            self._unbuilt_settings.pop(definition.key, None)
+            keys.append(definition.key)
+
+        # Show the (possibly preset/reset) config values
+        self._load_widget_values(keys)
+
+    def _fill_category_tab(self, tab_frame: ttk.Frame, settings: list):
+        """Create the scrollable setting cards for a category tab."""
         # Canvas for scrolling with dark background
         canvas = tk.Canvas(tab_frame, highlightthickness=0,
                           bg=self.colors['bg_dark'], borderwidth=0)
         scrollbar = ttk.Scrollbar(tab_frame, orient="vertical", command=canvas.yview)
         scrollable_frame = ttk.Frame(canvas)
 
-        scrollable_frame.bind(
-            "<Configure>",
-            lambda e: canvas.configure(scrollregion=canvas.bbox("all"))
-        )
+        self._bind_scrollregion(scrollable_frame, canvas)
 
         canvas.create_window((0, 0), window=scrollable_frame, anchor="nw")
         canvas.configure(yscrollcommand=scrollbar.set)
@@ -1643,9 +2122,7 @@ class ArcTunerApp:
         scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
 
         # Enable mousewheel scrolling
-        def _on_mousewheel(event):
-            canvas.yview_scroll(int(-1*(event.delta/120)), "units")
-        canvas.bind_all("<MouseWheel>", _on_mousewheel)
+        self._scroll_canvases.add(canvas)
 
         # Add settings with alternating card backgrounds for visual separation
         for i, definition in enumerate(settings):
@@ -1656,28 +2133,21 @@ class ArcTunerApp:
         # Card-style frame with dark theme
         frame = ttk.Frame(parent, style='Card.TFrame', padding="12")
         frame.pack(fill=tk.X, pady=4, padx=8)
-
-        # Left side: label and description
-        left_frame = ttk.Frame(frame, style='Card.TFrame')
-        left_frame.pack(side=tk.LEFT, fill=tk.X, expand=True)
+        frame.columnconfigure(1, weight=1)
 
         # Setting name with performance impact indicator
-        name_frame = ttk.Frame(left_frame, style='Card.TFrame')
-        name_frame.pack(fill=tk.X)
+        ttk.Label(frame, text=definition.display_name, style='Header.TLabel').grid(row=0, column=0, sticky="w")
 
-        ttk.Label(name_frame, text=definition.display_name, style='Header.TLabel').pack(side=tk.LEFT)
-
-        impact_style = f'Impact.{"VeryHigh" if definition.performance_impact == "Very High" else definition.performance_impact}.TLabel'
-        impact_text = f" [{definition.performance_impact} Impact]"
-        ttk.Label(name_frame, text=impact_text, style=impact_style).pack(side=tk.LEFT, padx=(10, 0))
+        impact_style, impact_text = _IMPACT_LABELS[definition.performance_impact]
+        ttk.Label(frame, text=impact_text, style=impact_style).grid(row=0, column=1, sticky="w", padx=(10, 0))
 
         # Description
-        desc_label = ttk.Label(left_frame, text=definition.description, style='Description.TLabel', wraplength=550)
-        desc_label.pack(fill=tk.X, pady=(4, 0))
+        desc_label = ttk.Label(frame, text=definition.description, style='Description.TLabel', wraplength=550)
+        desc_label.grid(row=1, column=0, columnspan=2, sticky="we", pady=(4, 0))
 
         # Right side: control widget
         right_frame = ttk.Frame(frame, style='Card.TFrame')
-        right_frame.pack(side=tk.RIGHT, padx=(20, 0))
+        right_frame.grid(row=0, column=2, rowspan=2, sticky="e", padx=(20, 0))
         
         widget = None
         var = None
@@ -1685,35 +2155,23 @@ class ArcTunerApp:
         if definition.setting_type == "choice":
             var = tk.StringVar()
             
-            # Handle options that are tuples (value, display_name)
-            if definition.options and isinstance(definition.options[0], tuple):
-                values = [opt[1] for opt in definition.options]
-                value_map = {opt[1]: opt[0] for opt in definition.options}
-                reverse_map = {opt[0]: opt[1] for opt in definition.options}
-            else:
-                values = definition.options
-                value_map = {v: v for v in values}
-                reverse_map = value_map
-                
+            values = [opt[1] for opt in definition.options]
+
             widget = ttk.Combobox(right_frame, textvariable=var, values=values, state="readonly", width=20)
             widget.pack()
-            
-            # Store maps for value conversion
-            widget._value_map = value_map
-            widget._reverse_map = reverse_map
-            var.trace_add('write', lambda *args, k=definition.key: self._on_setting_changed(k))
+            self._trace_setting_var(var, definition.key)
             
         elif definition.setting_type == "boolean":
             var = tk.BooleanVar()
             widget = ttk.Checkbutton(right_frame, variable=var, text="Enabled")
             widget.pack()
-            var.trace_add('write', lambda *args, k=definition.key: self._on_setting_changed(k))
+            self._trace_setting_var(var, definition.key)
             
         elif definition.setting_type == "number":
             var = tk.StringVar()
             widget = ttk.Entry(right_frame, textvariable=var, width=10)
             widget.pack()
-            var.trace_add('write', lambda *args, k=definition.key: self._on_setting_changed(k))
+            self._trace_setting_var(var, definition.key)
             
         elif definition.setting_type == "slider":
             var = tk.IntVar()
@@ -1726,15 +2184,14 @@ class ArcTunerApp:
                 to=definition.max_val, 
                 variable=var,
                 orient=tk.HORIZONTAL,
-                length=150
+                length=150,
+                command=lambda value, k=definition.key, v=var: self._on_slider_moved(k, v, value)
             )
             widget.pack(side=tk.LEFT)
             
             value_label = ttk.Label(slider_frame, textvariable=var, width=5)
             value_label.pack(side=tk.LEFT, padx=(5, 0))
             
-            var.trace_add('write', lambda *args, k=definition.key: self._on_setting_changed(k))
-            
         if widget and var:
             self.setting_widgets[definition.key] = {
                 'widget': widget,
@@ -1755,31 +2212,30 @@ class ArcTunerApp:
                                   command=self.competitive_canvas.yview)
         self.competitive_scrollable_frame = ttk.Frame(self.competitive_canvas)
 
-        self.competitive_scrollable_frame.bind(
-            "<Configure>",
-            lambda e: self.competitive_canvas.configure(scrollregion=self.competitive_canvas.bbox("all"))
-        )
+        self._bind_scrollregion(self.competitive_scrollable_frame, self.competitive_canvas)
 
         self.competitive_canvas.create_window((0, 0), window=self.competitive_scrollable_frame, anchor="nw")
         self.competitive_canvas.configure(yscrollcommand=scrollbar.set)
 
         self.competitive_canvas.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
         scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
-
-        # Build initial content
+        self._scroll_canvases.add(self.competitive_canvas)
+
+        # Row frame per competitive definition (by position, since keys repeat
+        # across sections), whether it was last built as active and its
+        # setting_widgets entry if so, so a refresh only rebuilds the rows
+        # whose state changed. None until the tab is first selected.
+        self._competitive_rows: Optional[Dict[int, tuple]] = None
+        self._pending_tabs[str(self.competitive_tab_frame)] = self._build_competitive_settings_tab
+
+    def _build_competitive_settings_tab(self):
+        """Build the competitive settings content the first time its tab is selected."""
+        self._competitive_rows = {}
+        self._create_competitive_header()
         self._refresh_competitive_settings_tab()
 
-    def _refresh_competitive_settings_tab(self):
-        """Refresh the competitive settings tab to show current state."""
-        # Clear existing widgets
-        for widget in self.competitive_scrollable_frame.winfo_children():
-            widget.destroy()
-
-        # Remove competitive settings from setting_widgets (they'll be re-added if in config)
-        for definition in self.competitive_settings_definitions:
-            if definition.key in self.setting_widgets:
-                del self.setting_widgets[definition.key]
-
+    def _create_competitive_header(self):
+        """Create the warning banner and bulk actions above the competitive settings."""
         # Warning banner
         warning_frame = ttk.Frame(self.competitive_scrollable_frame, style='Warning.TFrame', padding="12")
         warning_frame.pack(fill=tk.X, pady=(4, 8), padx=8)
@@ -1799,24 +2255,64 @@ class ArcTunerApp:
         ttk.Button(bulk_frame, text="- Remove All Settings", style='Remove.TButton',
                   command=self._remove_all_competitive_settings).pack(side=tk.LEFT)
 
+        self.competitive_status_label = ttk.Label(bulk_frame, text="", style='Status.TLabel')
+        self.competitive_status_label.pack(side=tk.LEFT, padx=(20, 0))
+
+        # Separator
+        sep = ttk.Frame(self.competitive_scrollable_frame, height=2)
+        sep.pack(fill=tk.X, padx=8, pady=4)
+
+    def _ensure_competitive_settings_tab(self):
+        """Build the competitive settings tab now if it hasn't been opened yet."""
+        build = self._pending_tabs.pop(str(self.competitive_tab_frame), None)
+        if build:
+            build()
+
+    def _refresh_competitive_settings_tab(self):
+        """Refresh the competitive settings tab to show current state."""
+        if self._competitive_rows is None:
+            return  # Not built yet; it reads the config when first selected
+
         # Count added/not added
-        added_count = sum(1 for d in self.competitive_settings_definitions
-                        if self._is_setting_in_config(d))
+        in_config = [self._is_setting_in_config(d) for d in self.competitive_settings_definitions]
+        added_count = sum(in_config)
         total_count = len(self.competitive_settings_definitions)
 
         status_text = f"  ({added_count}/{total_count} settings active in config)"
-        ttk.Label(bulk_frame, text=status_text, style='Status.TLabel').pack(side=tk.LEFT, padx=(20, 0))
+        self.competitive_status_label.config(text=status_text)
+
+        # Display each setting, rebuilding only rows that were added or removed.
+        # Unchanged active rows keep their widgets (and any unsaved edits);
+        # _load_config reloads their values itself.
+        for i, (definition, is_in_config) in enumerate(zip(self.competitive_settings_definitions, in_config)):
+            row = self._competitive_rows.get(i)
+            if row is None:
+                row_frame = ttk.Frame(self.competitive_scrollable_frame)
+                row_frame.pack(fill=tk.X)
+            else:
+                row_frame, was_in_config, old_widget_data = row
+                if was_in_config == is_in_config:
+                    continue
+                for widget in row_frame.winfo_children():
+                    widget.destroy()
+                # Stop mapping the destroyed row's variable to its setting
+                if old_widget_data:
+                    self._var_keys.pop(str(old_widget_data['var']), None)
+
+            widget_data = self.setting_widgets.get(definition.key)
+            if not is_in_config and widget_data and widget_data['definition'] is definition:
+                del self.setting_widgets[definition.key]
 
-        # Separator
-        sep = ttk.Frame(self.competitive_scrollable_frame, height=2)
-        sep.pack(fill=tk.X, padx=8, pady=4)
+            self._create_competitive_setting_widget(row_frame, definition, i, is_in_config)
+            widget_data = self.setting_widgets.get(definition.key) if is_in_config else None
+            self._competitive_rows[i] = (row_frame, is_in_config, widget_data)
 
-        # Display each setting
-        for i, definition in enumerate(self.competitive_settings_definitions):
-            is_in_config = self._is_setting_in_config(definition)
-            self._create_competitive_setting_widget(
-                self.competitive_scrollable_frame, definition, i, is_in_config
-            )
+        # Rows sharing a key (bEnableMouseSmoothing is in two sections) share
+        # one setting_widgets entry; re-register an unchanged active row whose
+        # entry was dropped along with a removed row
+        for _, _, widget_data in self._competitive_rows.values():
+            if widget_data and widget_data['definition'].key not in self.setting_widgets:
+                self.setting_widgets[widget_data['definition'].key] = widget_data
 
     def _is_setting_in_config(self, definition: SettingDefinition) -> bool:
         """Check if a competitive setting exists in the current config."""
@@ -1837,34 +2333,25 @@ class ArcTunerApp:
             # Setting IS in config - show full controls with Remove button
             frame = ttk.Frame(parent, style='Card.TFrame', padding="12")
             frame.pack(fill=tk.X, pady=4, padx=8)
+            frame.columnconfigure(1, weight=1)
 
             # Status indicator
-            status_frame = ttk.Frame(frame, style='Card.TFrame')
-            status_frame.pack(fill=tk.X)
-
-            ttk.Label(status_frame, text="ACTIVE", foreground=self.colors['success'],
-                     background=self.colors['bg_medium'], font=('Segoe UI', 8, 'bold')).pack(side=tk.LEFT)
+            ttk.Label(frame, text="ACTIVE", foreground=self.colors['success'],
+                     background=self.colors['bg_medium'], font='ArcTinyBold').grid(row=0, column=0, sticky="w")
 
             # Left side: label and description
-            left_frame = ttk.Frame(frame, style='Card.TFrame')
-            left_frame.pack(side=tk.LEFT, fill=tk.X, expand=True)
-
-            name_frame = ttk.Frame(left_frame, style='Card.TFrame')
-            name_frame.pack(fill=tk.X)
+            ttk.Label(frame, text=definition.display_name, style='Header.TLabel').grid(row=1, column=0, sticky="w")
 
-            ttk.Label(name_frame, text=definition.display_name, style='Header.TLabel').pack(side=tk.LEFT)
+            impact_style, impact_text = _IMPACT_LABELS[definition.performance_impact]
+            ttk.Label(frame, text=impact_text, style=impact_style).grid(row=1, column=1, sticky="w", padx=(10, 0))
 
-            impact_style = f'Impact.{"VeryHigh" if definition.performance_impact == "Very High" else definition.performance_impact}.TLabel'
-            impact_text = f" [{definition.performance_impact} Impact]"
-            ttk.Label(name_frame, text=impact_text, style=impact_style).pack(side=tk.LEFT, padx=(10, 0))
-
-            desc_label = ttk.Label(left_frame, text=definition.description,
+            desc_label = ttk.Label(frame, text=definition.description,
                                   style='Description.TLabel', wraplength=450)
-            desc_label.pack(fill=tk.X, pady=(4, 0))
+            desc_label.grid(row=2, column=0, columnspan=2, sticky="we", pady=(4, 0))
 
             # Right side: control widget + Remove button
             right_frame = ttk.Frame(frame, style='Card.TFrame')
-            right_frame.pack(side=tk.RIGHT, padx=(20, 0))
+            right_frame.grid(row=1, column=2, rowspan=2, sticky="e", padx=(20, 0))
 
             # Control widget
             control_frame = ttk.Frame(right_frame, style='Card.TFrame')
@@ -1875,28 +2362,19 @@ class ArcTunerApp:
 
             if definition.setting_type == "choice":
                 var = tk.StringVar()
-                if definition.options and isinstance(definition.options[0], tuple):
-                    values = [opt[1] for opt in definition.options]
-                    value_map = {opt[1]: opt[0] for opt in definition.options}
-                    reverse_map = {opt[0]: opt[1] for opt in definition.options}
-                else:
-                    values = definition.options
-                    value_map = {v: v for v in values}
-                    reverse_map = value_map
+                values = [opt[1] for opt in definition.options]
 
                 widget = ttk.Combobox(control_frame, textvariable=var, values=values,
                                      state="readonly", width=18)
                 widget.pack()
-                widget._value_map = value_map
-                widget._reverse_map = reverse_map
 
                 # Set current value from config
                 current_val = self.config_manager.get_setting(definition.key)
                 if current_val:
-                    display_val = reverse_map.get(current_val, current_val)
+                    display_val = definition.reverse_map.get(current_val, current_val)
                     var.set(display_val)
 
-                var.trace_add('write', lambda *args, k=definition.key: self._on_setting_changed(k))
+                self._trace_setting_var(var, definition.key)
 
             elif definition.setting_type == "boolean":
                 var = tk.BooleanVar()
@@ -1907,7 +2385,7 @@ class ArcTunerApp:
                 if current_val:
                     var.set(current_val.lower() == 'true')
 
-                var.trace_add('write', lambda *args, k=definition.key: self._on_setting_changed(k))
+                self._trace_setting_var(var, definition.key)
 
             elif definition.setting_type == "number":
                 var = tk.StringVar()
@@ -1918,7 +2396,7 @@ class ArcTunerApp:
                 if current_val:
                     var.set(current_val)
 
-                var.trace_add('write', lambda *args, k=definition.key: self._on_setting_changed(k))
+                self._trace_setting_var(var, definition.key)
 
             elif definition.setting_type == "slider":
                 var = tk.IntVar()
@@ -1927,7 +2405,8 @@ class ArcTunerApp:
 
                 widget = ttk.Scale(slider_subframe, from_=definition.min_val,
                                   to=definition.max_val, variable=var,
-                                  orient=tk.HORIZONTAL, length=120)
+                                  orient=tk.HORIZONTAL, length=120,
+                                  command=lambda value, k=definition.key, v=var: self._on_slider_moved(k, v, value))
                 widget.pack(side=tk.LEFT)
 
                 value_label = ttk.Label(slider_subframe, textvariable=var, width=5,
@@ -1941,8 +2420,6 @@ class ArcTunerApp:
                     except ValueError:
                         var.set(int(definition.default))
 
-                var.trace_add('write', lambda *args, k=definition.key: self._on_setting_changed(k))
-
             if widget and var:
                 self.setting_widgets[definition.key] = {
                     'widget': widget,
@@ -1958,35 +2435,27 @@ class ArcTunerApp:
             # Setting NOT in config - show dimmed card with Add button
             frame = ttk.Frame(parent, style='NotAdded.TFrame', padding="12")
             frame.pack(fill=tk.X, pady=4, padx=8)
+            frame.columnconfigure(1, weight=1)
 
             # Status indicator
-            status_frame = ttk.Frame(frame, style='NotAdded.TFrame')
-            status_frame.pack(fill=tk.X)
-
-            ttk.Label(status_frame, text="NOT ADDED", foreground=self.colors['text_dark'],
-                     background='#252525', font=('Segoe UI', 8, 'bold')).pack(side=tk.LEFT)
+            ttk.Label(frame, text="NOT ADDED", foreground=self.colors['text_dark'],
+                     background='#252525', font='ArcTinyBold').grid(row=0, column=0, sticky="w")
 
             # Left side: label and description
-            left_frame = ttk.Frame(frame, style='NotAdded.TFrame')
-            left_frame.pack(side=tk.LEFT, fill=tk.X, expand=True)
-
-            name_frame = ttk.Frame(left_frame, style='NotAdded.TFrame')
-            name_frame.pack(fill=tk.X)
-
-            ttk.Label(name_frame, text=definition.display_name,
-                     style='NotAddedHeader.TLabel').pack(side=tk.LEFT)
+            ttk.Label(frame, text=definition.display_name,
+                     style='NotAddedHeader.TLabel').grid(row=1, column=0, sticky="w")
 
             # Show default value hint
             default_text = f" [Default: {definition.default}]"
-            ttk.Label(name_frame, text=default_text, style='NotAddedDesc.TLabel').pack(side=tk.LEFT, padx=(10, 0))
+            ttk.Label(frame, text=default_text, style='NotAddedDesc.TLabel').grid(row=1, column=1, sticky="w", padx=(10, 0))
 
-            desc_label = ttk.Label(left_frame, text=definition.description,
+            desc_label = ttk.Label(frame, text=definition.description,
                                   style='NotAddedDesc.TLabel', wraplength=550)
-            desc_label.pack(fill=tk.X, pady=(4, 0))
+            desc_label.grid(row=2, column=0, columnspan=2, sticky="we", pady=(4, 0))
 
             # Right side: Add button
             right_frame = ttk.Frame(frame, style='NotAdded.TFrame')
-            right_frame.pack(side=tk.RIGHT, padx=(20, 0))
+            right_frame.grid(row=1, column=2, rowspan=2, sticky="e", padx=(20, 0))
 
             ttk.Button(right_frame, text="+ Add", style='Add.TButton',
                       command=lambda d=definition: self._add_competitive_setting(d)).pack()
@@ -1998,7 +2467,7 @@ class ArcTunerApp:
             self.config_manager.current_config[definition.section] = {}
 
         # Add with default value
-        default_val = str(definition.default)
+        default_val = definition.default_str
         self.config_manager.current_config[definition.section][definition.key] = default_val
 
         self.unsaved_changes = True
@@ -2028,11 +2497,10 @@ class ArcTunerApp:
                                    "Continue?"):
             return
 
+        config = self.config_manager.current_config
         for definition in self.competitive_settings_definitions:
-            if not self._is_setting_in_config(definition):
-                if definition.section not in self.config_manager.current_config:
-                    self.config_manager.current_config[definition.section] = {}
-                self.config_manager.current_config[definition.section][definition.key] = str(definition.default)
+            # Keep values already in the config; add the rest at their defaults
+            config.setdefault(definition.section, {}).setdefault(definition.key, definition.default_str)
 
         self.unsaved_changes = True
         self._update_changes_label()
@@ -2046,13 +2514,13 @@ class ArcTunerApp:
                                    "Continue?"):
             return
 
+        config = self.config_manager.current_config
         for definition in self.competitive_settings_definitions:
-            if definition.section in self.config_manager.current_config:
-                if definition.key in self.config_manager.current_config[definition.section]:
-                    del self.config_manager.current_config[definition.section][definition.key]
+            section_config = config.get(definition.section)
+            if section_config:
+                section_config.pop(definition.key, None)
 
-            if definition.key in self.setting_widgets:
-                del self.setting_widgets[definition.key]
+            self.setting_widgets.pop(definition.key, None)
 
         self.unsaved_changes = True
         self._update_changes_label()
@@ -2062,8 +2530,23 @@ class ArcTunerApp:
         """Bind keyboard and window events."""
         self.root.bind('<Control-o>', lambda e: self._browse_config())
         self.root.bind('<Control-s>', lambda e: self._save_config())
+        self.root.bind_all("<MouseWheel>", self._on_mousewheel)
         self.root.protocol("WM_DELETE_WINDOW", self._on_close)
         
+    def _on_mousewheel(self, event):
+        """Scroll the tab canvas under the mouse pointer, if any."""
+        try:
+            widget = self.root.winfo_containing(event.x_root, event.y_root)
+        except KeyError:
+            # Pointer is over a Tk-internal widget (e.g. a combobox popdown)
+            return
+
+        while widget is not None:
+            if widget in self._scroll_canvases:
+                widget.yview_scroll(int(-1*(event.delta/120)), "units")
+                return
+            widget = widget.master
+
     def _auto_detect_config(self):
         """Try to auto-detect the config file location."""
         if self.config_manager.initialize():
@@ -2096,36 +2579,9 @@ class ArcTunerApp:
         try:
             config = self.config_manager.read_config()
             
-            for key, widget_data in self.setting_widgets.items():
-                value = self.config_manager.get_setting(key)
-                if value is None:
-                    continue
-                    
-                var = widget_data['var']
-                widget = widget_data['widget']
-                definition = widget_data['definition']
-                
-                if definition.setting_type == "choice":
-                    # Convert stored value to display value
-                    if hasattr(widget, '_reverse_map'):
-                        display_value = widget._reverse_map.get(value, value)
-                        var.set(display_value)
-                    else:
-                        var.set(value)
+            self._load_widget_values(list(self.setting_widgets))
                         
-                elif definition.setting_type == "boolean":
-                    var.set(value.lower() == 'true')
-                    
-                elif definition.setting_type in ("number", "slider"):
-                    try:
-                        if definition.setting_type == "slider":
-                            var.set(int(float(value)))
-                        else:
-                            var.set(value)
-                    except ValueError:
-                        var.set(str(definition.default))
-                        
-            self.status_label.config(text=f"Loaded: {self.config_manager.config_path}")
+            self._set_status(f"Loaded: {self.config_manager.config_path}")
             self.unsaved_changes = False
             self._update_changes_label()
 
@@ -2137,41 +2593,97 @@ class ArcTunerApp:
             logger.error(f"Failed to load config: {e}")
             messagebox.showerror("Error", f"Failed to load config: {e}")
             
+    @contextmanager
+    def _untracked_widget_updates(self):
+        """Suspend unsaved-change tracking while widgets are set in bulk."""
+        self._loading_widgets = True
+        try:
+            yield
+        finally:
+            self._loading_widgets = False
+
+    def _load_widget_values(self, keys: list):
+        """Set the given settings' widgets from the current config."""
+        with self._untracked_widget_updates():
+            self._set_widget_values(keys)
+
+    def _set_widget_values(self, keys: list):
+        """Copy config values into the given settings' widgets."""
+        for key in keys:
+            widget_data = self.setting_widgets.get(key)
+            if widget_data is None:
+                continue
+
+            value = self.config_manager.get_setting(key)
+            if value is None:
+                continue
+
+            try:
+                self._set_widget_value(widget_data, value)
+            except ValueError:
+                self._set_widget_value(widget_data, widget_data['definition'].default_str)
+
+    def _set_widget_value(self, widget_data: dict, value: str):
+        """Show a stored config value in a setting's widget."""
+        definition = widget_data['definition']
+        _VAR_CONVERTERS[definition.setting_type][0](widget_data['var'], definition, value)
+
+    def _get_widget_value(self, widget_data: dict) -> str:
+        """Return a setting's widget value as it is stored in the config."""
+        definition = widget_data['definition']
+        return _VAR_CONVERTERS[definition.setting_type][1](widget_data['var'], definition)
+
+    def _store_widget_values(self) -> bool:
+        """
+        Copy every built setting widget's value into the config.
+
+        Changed values are checked first; if any is invalid the user is asked
+        whether to continue, keeping the previous config value for those.
+        Returns False, with the config untouched, if they decline.
+        """
+        values = {key: self._get_widget_value(widget_data)
+                  for key, widget_data in self.setting_widgets.items()}
+        rejected = [self.setting_widgets[key]['definition'].display_name
+                    for key, value in values.items()
+                    if not self.config_manager.accepts_setting(key, value)]
+
+        if rejected:
+            names = "\n".join(f"  • {name}" for name in rejected)
+            if not messagebox.askyesno(
+                    "Invalid Values",
+                    f"These settings have invalid values and will keep their previous value:\n\n{names}\n\n"
+                    "Continue anyway?"):
+                return False
+
+        for key, value in values.items():
+            self.config_manager.set_setting(key, value)
+        return True
+
     def _save_config(self):
         """Save current settings to config file."""
         if not self.config_manager.config_path:
             messagebox.showerror("Error", "No config file loaded")
             return
+
+        # Update config with current widget values
+        if not self._store_widget_values():
+            return
             
         # Create backup before saving
         backup = self.config_manager.create_backup("pre_save")
         if backup:
             logger.info(f"Backup created before save: {backup}")
-            
-        # Update config with current widget values
-        for key, widget_data in self.setting_widgets.items():
-            var = widget_data['var']
-            widget = widget_data['widget']
-            definition = widget_data['definition']
-            
-            if definition.setting_type == "choice":
-                display_value = var.get()
-                if hasattr(widget, '_value_map'):
-                    value = widget._value_map.get(display_value, display_value)
-                else:
-                    value = display_value
-            elif definition.setting_type == "boolean":
-                value = "True" if var.get() else "False"
-            else:
-                value = str(var.get())
-                
-            self.config_manager.set_setting(key, value)
+
+        # Settings on tabs that were never opened keep their config value
+        # (or default when missing), as their widgets would have
+        for key in self._unbuilt_settings:
+            self.config_manager.set_setting(key, self.config_manager.get_setting(key))
             
         # Write to file
         if self.config_manager.write_config(self.config_manager.current_config):
             self.unsaved_changes = False
             self._update_changes_label()
-            messagebox.showinfo("Saved", "Configuration saved successfully!\n\nA backup was created automatically.")
+            self._flash_status("✓ Configuration saved (a backup was created automatically)")
         else:
             messagebox.showerror("Error", "Failed to save configuration")
             
@@ -2186,30 +2698,76 @@ class ArcTunerApp:
         """Reset all settings to defaults."""
         if not messagebox.askyesno("Reset", "Reset all settings to defaults?"):
             return
+
+        # Active competitive settings are reset through their widgets
+        self._ensure_competitive_settings_tab()
             
-        for key, widget_data in self.setting_widgets.items():
-            var = widget_data['var']
-            widget = widget_data['widget']
-            definition = widget_data['definition']
-            
-            if definition.setting_type == "choice":
-                if hasattr(widget, '_reverse_map'):
-                    display_value = widget._reverse_map.get(str(definition.default), str(definition.default))
-                    var.set(display_value)
-                else:
-                    var.set(str(definition.default))
-            elif definition.setting_type == "boolean":
-                var.set(definition.default)
-            else:
-                var.set(str(definition.default))
+        with self._untracked_widget_updates():
+            for widget_data in self.setting_widgets.values():
+                self._set_widget_value(widget_data, widget_data['definition'].default_str)
+
+        for key in self._unbuilt_settings:
+            self.config_manager.set_setting(key, _SETTING_DEFAULTS[_SETTING_INDEX[key]])
+        self.unsaved_changes = True
+        self._update_changes_label()
                 
+    def _trace_setting_var(self, var: tk.Variable, key: str):
+        """Flag unsaved changes whenever var is written."""
+        self._var_keys[str(var)] = key
+        self.root.tk.call('trace', 'add', 'variable', str(var), 'write', self._var_trace_cmd)
+
+    def _on_var_write(self, name: str, index: str, op: str):
+        """Tcl write trace shared by all setting variables."""
+        if self._loading_widgets:
+            return
+
+        key = self._var_keys.get(name)
+        if key is not None:
+            self._on_setting_changed(key)
+
     def _on_setting_changed(self, key: str):
         """Called when a setting value changes."""
+        if self.unsaved_changes:
+            # The indicator already shows (or is about to show) unsaved changes
+            return
+
         self.unsaved_changes = True
-        self._update_changes_label()
+
+        # Widget traces fire on every keystroke and slider step; coalesce the
+        # indicator refresh so a drag updates it once rather than per pixel
+        if self._changes_label_job is None:
+            self._changes_label_job = self.root.after(50, self._update_changes_label)
         
+    def _on_slider_moved(self, key: str, var: tk.IntVar, value: str):
+        """Called when the user moves a slider; snaps it to whole numbers."""
+        var.set(int(float(value)))
+        self._on_setting_changed(key)
+
+    def _set_status(self, text: str):
+        """Set the status bar text, shown once any flashed message expires."""
+        self._status_text = text
+        if self._status_flash_job is None:
+            self.status_label.config(text=text)
+
+    def _flash_status(self, message: str, duration_ms: int = 4000):
+        """Briefly show a success message in the status bar instead of a dialog."""
+        if self._status_flash_job is not None:
+            self.root.after_cancel(self._status_flash_job)
+        self.status_label.config(text=message, foreground=self.colors['success'])
+        self._status_flash_job = self.root.after(duration_ms, self._end_status_flash)
+
+    def _end_status_flash(self):
+        """Restore the status bar after a _flash_status message."""
+        self._status_flash_job = None
+        # An empty foreground falls back to the Status.TLabel style's color
+        self.status_label.config(text=self._status_text, foreground='')
+
     def _update_changes_label(self):
         """Update the unsaved changes indicator."""
+        if self._changes_label_job is not None:
+            self.root.after_cancel(self._changes_label_job)
+            self._changes_label_job = None
+
         if self.unsaved_changes:
             self.changes_label.config(text="● UNSAVED CHANGES", foreground=self.colors['warning'])
         else:
@@ -2224,23 +2782,20 @@ class ArcTunerApp:
         if not messagebox.askyesno("Apply Preset", f"Apply '{preset_name}' preset?\n\n{preset['description']}"):
             return
             
-        for key, value in preset['settings'].items():
-            if key in self.setting_widgets:
-                widget_data = self.setting_widgets[key]
-                var = widget_data['var']
-                widget = widget_data['widget']
-                definition = widget_data['definition']
-                
-                if definition.setting_type == "choice":
-                    if hasattr(widget, '_reverse_map'):
-                        display_value = widget._reverse_map.get(value, value)
-                        var.set(display_value)
-                    else:
-                        var.set(value)
-                elif definition.setting_type == "boolean":
-                    var.set(value.lower() == 'true')
-                else:
-                    var.set(value)
+        # Tabs not built yet (including Competitive Settings) read the applied
+        # values from the config when first opened
+        self.config_manager.apply_preset(preset_name)
+
+        # Show the applied values in built widgets. Competitive settings the
+        # preset skipped (not in the config) keep theirs, as does the row of a
+        # shared key in the section the preset does not write.
+        config = self.config_manager.current_config
+        with self._untracked_widget_updates():
+            for section, key, value in zip(*_PRESET_ARRAYS[preset_name]):
+                widget_data = self.setting_widgets.get(key)
+                if (widget_data and widget_data['definition'].section == section
+                        and key in config.get(section, _EMPTY_SECTION)):
+                    self._set_widget_value(widget_data, value)
                     
         self.unsaved_changes = True
         self._update_changes_label()
@@ -2249,7 +2804,7 @@ class ArcTunerApp:
         """Create a manual backup."""
         backup = self.config_manager.create_backup("manual")
         if backup:
-            messagebox.showinfo("Backup Created", f"Backup saved to:\n{backup}")
+            self._flash_status(f"✓ Backup saved to: {backup}")
         else:
             messagebox.showerror("Error", "Failed to create backup")
             
@@ -2279,10 +2834,9 @@ class ArcTunerApp:
         listbox.pack(fill=tk.BOTH, expand=True)
         scrollbar.config(command=listbox.yview)
         
-        backup_paths = []
-        for backup in backups:
-            listbox.insert(tk.END, f"{backup['name']} ({backup['date'].strftime('%Y-%m-%d %H:%M')})")
-            backup_paths.append(backup['path'])
+        backup_paths = [backup['path'] for backup in backups]
+        listbox.insert(tk.END, *[f"{backup['name']} ({backup['date'].strftime('%Y-%m-%d %H:%M')})"
+                                 for backup in backups])
             
         def restore_selected():
             selection = listbox.curselection()
@@ -2330,27 +2884,12 @@ class ArcTunerApp:
                 return
                 
             # Update config with current values first
-            for key, widget_data in self.setting_widgets.items():
-                var = widget_data['var']
-                widget = widget_data['widget']
-                definition = widget_data['definition']
-                
-                if definition.setting_type == "choice":
-                    display_value = var.get()
-                    if hasattr(widget, '_value_map'):
-                        value = widget._value_map.get(display_value, display_value)
-                    else:
-                        value = display_value
-                elif definition.setting_type == "boolean":
-                    value = "True" if var.get() else "False"
-                else:
-                    value = str(var.get())
-                    
-                self.config_manager.set_setting(key, value)
-                
+            if not self._store_widget_values():
+                return
+
             if self.config_manager.save_profile(name, self.config_manager.current_config):
                 dialog.destroy()
-                messagebox.showinfo("Saved", f"Profile '{name}' saved successfully")
+                self._flash_status(f"✓ Profile '{name}' saved")
             else:
                 messagebox.showerror("Error", "Failed to save profile")
                 
@@ -2381,10 +2920,8 @@ class ArcTunerApp:
         listbox.pack(fill=tk.BOTH, expand=True)
         scrollbar.config(command=listbox.yview)
         
-        profile_names = []
-        for profile in profiles:
-            listbox.insert(tk.END, profile['name'])
-            profile_names.append(profile['name'])
+        profile_names = [profile['name'] for profile in profiles]
+        listbox.insert(tk.END, *profile_names)
             
         def load_selected():
             selection = listbox.curselection()
@@ -2399,32 +2936,8 @@ class ArcTunerApp:
                 self.config_manager.current_config = config
                 
                 # Update widgets
-                for key, widget_data in self.setting_widgets.items():
-                    value = self.config_manager.get_setting(key)
-                    if value is None:
-                        continue
-                        
-                    var = widget_data['var']
-                    widget = widget_data['widget']
-                    definition = widget_data['definition']
-                    
-                    if definition.setting_type == "choice":
-                        if hasattr(widget, '_reverse_map'):
-                            display_value = widget._reverse_map.get(value, value)
-                            var.set(display_value)
-                        else:
-                            var.set(value)
-                    elif definition.setting_type == "boolean":
-                        var.set(value.lower() == 'true')
-                    elif definition.setting_type in ("number", "slider"):
-                        try:
-                            if definition.setting_type == "slider":
-                                var.set(int(float(value)))
-                            else:
-                                var.set(value)
-                        except ValueError:
-                            pass
-                            
+                self._load_widget_values(list(self.setting_widgets))
+
                 self.unsaved_changes = True
                 self._update_changes_label()
                 dialog.destroy()
@@ -2456,10 +2969,8 @@ class ArcTunerApp:
         listbox.pack(fill=tk.BOTH, expand=True)
         scrollbar.config(command=listbox.yview)
         
-        profile_names = []
-        for profile in profiles:
-            listbox.insert(tk.END, f"{profile['name']} ({profile['created'][:10] if len(profile['created']) > 10 else profile['created']})")
-            profile_names.append(profile['name'])
+        profile_names = [profile['name'] for profile in profiles]
+        listbox.insert(tk.END, *[f"{profile['name']} ({profile['created'][:10]})" for profile in profiles])
             
         def delete_selected():
             selection = listbox.curselection()
@@ -7,96 +7,136 @@ Or without pytest: python tests.py
 """
 
 import os
+import stat
 import sys
 import tempfile
 import json
 from pathlib import Path
 from datetime import datetime
+from contextlib import contextmanager
 from unittest.mock import Mock, patch, MagicMock
 
-# Mock tkinter before importing arc_tuner (for headless testing)
-class MockTk:
-    def __init__(self): pass
-    def mainloop(self): pass
-    def title(self, *args): pass
-    def geometry(self, *args): pass
-    def minsize(self, *args): pass
-    def config(self, **kwargs): pass
-    def bind(self, *args): pass
-    def protocol(self, *args): pass
-
-class MockModule:
-    Tk = MockTk
-    Frame = type('Frame', (), {'__init__': lambda *a, **k: None, 'pack': lambda *a, **k: None})
-    Label = type('Label', (), {'__init__': lambda *a, **k: None, 'pack': lambda *a, **k: None, 'config': lambda *a, **k: None})
-    Canvas = type('Canvas', (), {'__init__': lambda *a, **k: None})
-    Menu = type('Menu', (), {'__init__': lambda *a, **k: None, 'add_cascade': lambda *a, **k: None, 'add_command': lambda *a, **k: None, 'add_separator': lambda *a, **k: None})
-    StringVar = type('StringVar', (), {'__init__': lambda *a, **k: None, 'set': lambda *a, **k: None, 'get': lambda s: '', 'trace_add': lambda *a, **k: None})
-    BooleanVar = type('BooleanVar', (), {'__init__': lambda *a, **k: None, 'set': lambda *a, **k: None, 'get': lambda s: False, 'trace_add': lambda *a, **k: None})
-    IntVar = type('IntVar', (), {'__init__': lambda *a, **k: None, 'set': lambda *a, **k: None, 'get': lambda s: 0, 'trace_add': lambda *a, **k: None})
-    Toplevel = type('Toplevel', (), {'__init__': lambda *a, **k: None})
-    Listbox = type('Listbox', (), {'__init__': lambda *a, **k: None})
-    Entry = type('Entry', (), {'__init__': lambda *a, **k: None})
-    BOTH = 'both'
-    X = 'x'
-    Y = 'y'
-    LEFT = 'left'
-    RIGHT = 'right'
-    TOP = 'top'
-    BOTTOM = 'bottom'
-    END = 'end'
-    HORIZONTAL = 'horizontal'
-    VERTICAL = 'vertical'
-
-class MockTTK:
-    Style = type('Style', (), {'__init__': lambda *a, **k: None, 'theme_use': lambda *a, **k: None, 'theme_names': lambda s: ['clam'], 'configure': lambda *a, **k: None})
-    Frame = MockModule.Frame
-    Label = MockModule.Label
-    Button = type('Button', (), {'__init__': lambda *a, **k: None, 'pack': lambda *a, **k: None})
-    Combobox = type('Combobox', (), {'__init__': lambda *a, **k: None, 'pack': lambda *a, **k: None})
-    Checkbutton = type('Checkbutton', (), {'__init__': lambda *a, **k: None, 'pack': lambda *a, **k: None})
-    Notebook = type('Notebook', (), {'__init__': lambda *a, **k: None, 'pack': lambda *a, **k: None, 'add': lambda *a, **k: None})
-    Scrollbar = type('Scrollbar', (), {'__init__': lambda *a, **k: None, 'pack': lambda *a, **k: None, 'config': lambda *a, **k: None})
-    Entry = MockModule.Entry
-    Scale = type('Scale', (), {'__init__': lambda *a, **k: None, 'pack': lambda *a, **k: None})
-
-class MockMessagebox:
-    @staticmethod
-    def showinfo(*args, **kwargs): pass
-    @staticmethod
-    def showwarning(*args, **kwargs): pass
-    @staticmethod
-    def showerror(*args, **kwargs): pass
-    @staticmethod
-    def askyesno(*args, **kwargs): return True
-
-class MockFiledialog:
-    @staticmethod
-    def askopenfilename(*args, **kwargs): return ''
-
-# Apply mocks before any imports
-MockModule.ttk = MockTTK
-MockModule.messagebox = MockMessagebox
-MockModule.filedialog = MockFiledialog
-
-sys.modules['tkinter'] = MockModule
-sys.modules['tkinter.ttk'] = MockTTK
-sys.modules['tkinter.messagebox'] = MockMessagebox
-sys.modules['tkinter.filedialog'] = MockFiledialog
-
-# Import tk module parts that arc_tuner expects
-MockModule.Tk = MockTk
-MockModule.BOTH = 'both'
-MockModule.X = 'x'
-MockModule.Y = 'y'
-MockModule.LEFT = 'left'
-MockModule.RIGHT = 'right'
-MockModule.TOP = 'top'
-MockModule.END = 'end'
-MockModule.HORIZONTAL = 'horizontal'
+
+def _install_tk_mocks():
+    """Install stand-in tkinter modules, for machines without Tk."""
+    class MockTk:
+        def __init__(self): pass
+        def mainloop(self): pass
+        def title(self, *args): pass
+        def geometry(self, *args): pass
+        def minsize(self, *args): pass
+        def config(self, **kwargs): pass
+        def bind(self, *args): pass
+        def protocol(self, *args): pass
+
+    def _noop(*args, **kwargs):
+        pass
+
+    def _stub(name, *methods, **attrs):
+        """Build a stand-in class whose constructor and listed methods do nothing."""
+        namespace = dict.fromkeys(('__init__',) + methods, _noop)
+        namespace.update(attrs)
+        return type(name, (), namespace)
+
+    class MockModule:
+        Tk = MockTk
+        Frame = _stub('Frame', 'pack')
+        Label = _stub('Label', 'pack', 'config')
+        Canvas = _stub('Canvas')
+        Menu = _stub('Menu', 'add_cascade', 'add_command', 'add_separator')
+        StringVar = _stub('StringVar', 'set', 'trace_add', get=lambda s: '')
+        BooleanVar = _stub('BooleanVar', 'set', 'trace_add', get=lambda s: False)
+        IntVar = _stub('IntVar', 'set', 'trace_add', get=lambda s: 0)
+        Toplevel = _stub('Toplevel')
+        Listbox = _stub('Listbox')
+        Entry = _stub('Entry')
+        BOTH = 'both'
+        X = 'x'
+        Y = 'y'
+        LEFT = 'left'
+        RIGHT = 'right'
+        TOP = 'top'
+        BOTTOM = 'bottom'
+        END = 'end'
+        HORIZONTAL = 'horizontal'
+        VERTICAL = 'vertical'
+
+    class MockTTK:
+        Style = _stub('Style', 'theme_use', 'configure', theme_names=lambda s: ['clam'])
+        Frame = MockModule.Frame
+        Label = MockModule.Label
+        Button = _stub('Button', 'pack')
+        Combobox = _stub('Combobox', 'pack')
+        Checkbutton = _stub('Checkbutton', 'pack')
+        Notebook = _stub('Notebook', 'pack', 'add')
+        Scrollbar = _stub('Scrollbar', 'pack', 'config')
+        Entry = MockModule.Entry
+        Scale = _stub('Scale', 'pack')
+
+    class MockMessagebox:
+        @staticmethod
+        def showinfo(*args, **kwargs): pass
+        @staticmethod
+        def showwarning(*args, **kwargs): pass
+        @staticmethod
+        def showerror(*args, **kwargs): pass
+        @staticmethod
+        def askyesno(*args, **kwargs): return True
+
+    class MockFiledialog:
+        @staticmethod
+        def askopenfilename(*args, **kwargs): return ''
+
+    # Apply mocks before any imports
+    MockModule.ttk = MockTTK
+    MockModule.messagebox = MockMessagebox
+    MockModule.filedialog = MockFiledialog
+
+    sys.modules['tkinter'] = MockModule
+    sys.modules['tkinter.ttk'] = MockTTK
+    sys.modules['tkinter.messagebox'] = MockMessagebox
+    sys.modules['tkinter.filedialog'] = MockFiledialog
+
+
+# arc_tuner only imports tkinter when the GUI starts, but mock it where Tk is
+# missing (e.g. headless CI) so any GUI code path under test still imports
+try:
+    import tkinter  # noqa: F401
+except ImportError:
+    _install_tk_mocks()
 
 # Now we can import
-from arc_tuner import ConfigManager, SETTINGS_DEFINITIONS, PRESETS, SettingDefinition
+import arc_tuner
+from arc_tuner import ConfigManager, SETTINGS_DEFINITIONS, PRESETS, SettingDefinition, get_settings_for_category
+
+
+# Config file fixtures
+_EMBARK_INI = b"""[/Script/EmbarkUserSettings.EmbarkGameUserSettings]
+DLSSMode=Quality
+NvReflexMode=Enabled
+bUseVSync=False
+FrameRateLimit=0.000000
+
+[ScalabilityGroups]
+sg.ShadowQuality=3
+sg.TextureQuality=3
+sg.ResolutionQuality=100
+"""
+_TRIVIAL_INI = b"[Test]\nkey=value\n"
+
+
+@contextmanager
+def _temp_config(content: bytes):
+    """
+    Yield the path of a config file holding content, in a throwaway directory.
+
+    ConfigManager puts its backup and profile directories next to the config,
+    so they are removed along with it.
+    """
+    with tempfile.TemporaryDirectory() as temp_dir:
+        path = Path(temp_dir) / "GameUserSettings.ini"
+        path.write_bytes(content)
+        yield path
 
 
 def test_setting_definitions():
@@ -122,6 +162,168 @@ def test_setting_definitions():
     print(f"✓ Categories: {', '.join(sorted(categories))}")
 
 
+def test_setting_definition_immutable():
+    """Test that setting definitions are frozen and carry no instance dict."""
+    print("\n=== Testing SettingDefinition Immutability ===")
+
+    defn = SETTINGS_DEFINITIONS['DLSSMode']
+    try:
+        defn.default = "DLAA"
+        assert False, "SettingDefinition should be frozen"
+    except AttributeError:
+        pass
+    print("✓ SettingDefinition is frozen")
+
+    if sys.version_info >= (3, 10):
+        assert not hasattr(defn, '__dict__'), "SettingDefinition should use __slots__"
+        print("✓ SettingDefinition uses __slots__")
+
+
+def test_choice_options_normalized():
+    """Test that choice options are normalized to (stored, display) pairs."""
+    print("\n=== Testing Choice Option Normalization ===")
+
+    assert SETTINGS_DEFINITIONS['DLSSModel'].options == (('Transformer', 'Transformer'), ('CNN', 'CNN'))
+    assert SETTINGS_DEFINITIONS['r.TextureStreaming'].options == \
+        (('0', 'Off (All High-Res)'), ('1', 'On (Dynamic)'))
+
+    for key, defn in SETTINGS_DEFINITIONS.items():
+        assert isinstance(defn.options, tuple), f"{key} options should be a tuple"
+        for opt in defn.options:
+            assert isinstance(opt, tuple) and len(opt) == 2, f"{key} has malformed option {opt!r}"
+            assert defn.value_map[opt[1]] == opt[0], f"{key} value_map missing {opt!r}"
+            assert defn.reverse_map[opt[0]] == opt[1], f"{key} reverse_map missing {opt!r}"
+
+    print("✓ All choice options are (stored, display) pairs")
+
+
+def test_var_converters():
+    """Test stored values round-trip through each setting type's widget variable."""
+    print("\n=== Testing Widget Value Conversion ===")
+    _VAR_CONVERTERS = arc_tuner._VAR_CONVERTERS
+
+    class Var:
+        value = None
+        def set(self, value): self.value = value
+        def get(self): return self.value
+
+    for key, stored in [('r.TextureStreaming', '0'), ('bUseVSync', 'True'),
+                        ('FrameRateLimit', '144.000000')]:
+        defn = SETTINGS_DEFINITIONS[key]
+        to_var, from_var = _VAR_CONVERTERS[defn.setting_type]
+        var = Var()
+        to_var(var, defn, stored)
+        assert from_var(var, defn) == stored, f"{key} did not round-trip"
+
+    var = Var()
+    _VAR_CONVERTERS['choice'][0](var, SETTINGS_DEFINITIONS['r.TextureStreaming'], '0')
+    assert var.get() == 'Off (All High-Res)'
+    _VAR_CONVERTERS['boolean'][0](var, SETTINGS_DEFINITIONS['bUseVSync'], 'false')
+    assert var.get() is False
+
+    print("✓ Widget values convert to and from stored values")
+
+
+def test_settings_by_category():
+    """Test the precomputed category index matches the definitions."""
+    print("\n=== Testing Category Index ===")
+
+    categories = set(d.category for d in SETTINGS_DEFINITIONS.values())
+    for category in categories:
+        expected = tuple(d for d in SETTINGS_DEFINITIONS.values() if d.category == category)
+        assert get_settings_for_category(category) == expected, \
+            f"Category index mismatch for {category}"
+
+    assert get_settings_for_category("No Such Category") == ()
+    print(f"✓ Category index covers {len(categories)} categories")
+
+
+def test_competitive_refresh_shared_key():
+    """Test that competitive rows sharing a setting key stay registered."""
+    print("\n=== Testing Competitive Tab Refresh ===")
+
+    definitions = tuple(d for d in get_settings_for_category("Competitive Settings")
+                        if d.key == 'bEnableMouseSmoothing')
+    assert len(definitions) == 2, "Expected bEnableMouseSmoothing in two sections"
+    input_def, engine_def = sorted(definitions, key=lambda d: d.section != '/Script/Engine.InputSettings')
+
+    # Drive the real refresh on a stand-in app; each active row registers a
+    # fresh widget entry when (re)built
+    app = MagicMock()
+    app.competitive_settings_definitions = definitions
+    app.setting_widgets = {}
+    app._competitive_rows = {}
+    app._var_keys = {}
+    active = {input_def.section: True, engine_def.section: True}
+    entries = {}
+    app._is_setting_in_config.side_effect = lambda d: active[d.section]
+
+    def create_row(parent, definition, row, is_in_config):
+        if is_in_config:
+            entries[definition.section] = {'widget': Mock(), 'var': Mock(), 'definition': definition}
+            app.setting_widgets[definition.key] = entries[definition.section]
+            app._var_keys[str(entries[definition.section]['var'])] = definition.key
+    app._create_competitive_setting_widget.side_effect = create_row
+
+    with patch.object(arc_tuner, 'ttk', MagicMock()), patch.object(arc_tuner, 'tk', MagicMock()):
+        arc_tuner.ArcTunerApp._refresh_competitive_settings_tab(app)
+        app._create_competitive_setting_widget.reset_mock()
+
+        # Removing the Engine row must leave the unchanged InputSettings row
+        # registered (without rebuilding it), or its edits would not be saved
+        active[engine_def.section] = False
+        arc_tuner.ArcTunerApp._refresh_competitive_settings_tab(app)
+
+    assert app._create_competitive_setting_widget.call_count == 1, "Only the removed row should be rebuilt"
+    assert app.setting_widgets['bEnableMouseSmoothing'] is entries[input_def.section], \
+        "Remaining active row should keep its widgets registered"
+    assert set(app._var_keys) == {str(entries[input_def.section]['var'])}, \
+        "Removed row's variable should no longer be traced"
+    print("✓ Shared-key row stays registered when the other is removed")
+
+
+def test_validate_setting_value():
+    """Test per-type validation of stored setting values."""
+    print("\n=== Testing Setting Validation ===")
+
+    validate = arc_tuner.validate_setting_value
+    assert validate('DLSSMode', 'Performance')
+    assert not validate('DLSSMode', 'Turbo')
+    assert validate('r.MaxAnisotropy', '16')
+    assert not validate('r.MaxAnisotropy', '16x (Best)')
+    print("✓ Choice values validated against stored option values")
+
+    assert validate('bUseVSync', 'False')
+    assert validate('bUseVSync', 'true')
+    assert not validate('bUseVSync', 'maybe')
+    print("✓ Boolean values validated")
+
+    assert validate('FrameRateLimit', '0.000000')
+    assert not validate('r.Streaming.PoolSize', '512')
+    assert not validate('r.Streaming.PoolSize', 'abc')
+    assert validate('sg.ResolutionQuality', '75')
+    print("✓ Number/slider values validated against range")
+
+    assert not validate('NoSuchSetting', '1')
+    print("✓ Unknown settings rejected")
+
+    cm = ConfigManager()
+    assert not cm.set_setting('r.Streaming.PoolSize', 'abc')
+    assert cm.current_config == {}, "Invalid value should not be stored"
+    print("✓ set_setting rejects invalid values")
+
+    # Values the game wrote outside the known options/ranges are kept as-is,
+    # but can't be changed to another invalid value
+    section = SETTINGS_DEFINITIONS['ResolutionScalingMethod'].section
+    cm.current_config = {section: {'ResolutionScalingMethod': '7', 'FrameRateLimit': '1000.000000'}}
+    assert cm.set_setting('ResolutionScalingMethod', '7')
+    assert cm.set_setting('FrameRateLimit', '1000.000000')
+    assert not cm.accepts_setting('FrameRateLimit', '900')
+    assert not cm.set_setting('ResolutionScalingMethod', '8')
+    assert cm.current_config[section]['ResolutionScalingMethod'] == '7'
+    print("✓ Unchanged config values accepted")
+
+
 def test_presets():
     """Test that all presets reference valid settings."""
     print("\n=== Testing Presets ===")
@@ -133,12 +335,58 @@ def test_presets():
         assert 'description' in preset, f"Preset {name} missing description"
         assert 'settings' in preset, f"Preset {name} missing settings"
         
-        for setting_key in preset['settings']:
-            assert setting_key in SETTINGS_DEFINITIONS, \
-                f"Preset {name} references unknown setting: {setting_key}"
+        unknown = preset['settings'].keys() - SETTINGS_DEFINITIONS.keys()
+        assert not unknown, f"Preset {name} references unknown settings: {sorted(unknown)}"
                 
     print("✓ All presets reference valid settings")
 
+    for name, preset in PRESETS.items():
+        for setting_key, value in preset['settings'].items():
+            assert arc_tuner.validate_setting_value(setting_key, value), \
+                f"Preset {name} has invalid value for {setting_key}: {value!r}"
+    print("✓ All preset values are valid")
+
+    try:
+        PRESETS['Competitive']['settings']['DLSSMode'] = 'DLAA'
+        assert False, "Presets should be read-only"
+    except TypeError:
+        pass
+    print("✓ Presets are read-only")
+
+
+def test_config_manager_apply_preset():
+    """Test applying a preset directly to the in-memory config."""
+    print("\n=== Testing ConfigManager.apply_preset ===")
+
+    cm = ConfigManager()
+    cm.current_config = {'ScalabilityGroups': {'sg.ShadowQuality': '3', 'sg.TextureQuality': '3'}}
+    assert cm.apply_preset('Competitive')
+
+    competitive = {d.key for d in get_settings_for_category("Competitive Settings")}
+    for key, value in PRESETS['Competitive']['settings'].items():
+        if key not in competitive:
+            assert cm.get_setting(key) == value, f"{key} not applied"
+    assert cm.current_config['ScalabilityGroups']['sg.TextureQuality'] == '3', \
+        "Settings outside the preset should be untouched"
+    print("✓ Preset values applied to config")
+
+    # Competitive settings are opt-in, as in the GUI: only ones already in the
+    # config are changed, and missing ones are not added
+    assert 'SystemSettings' not in cm.current_config
+    assert '/Script/Engine.InputSettings' not in cm.current_config
+    assert 'AudioQualityLevel' not in cm.current_config['/Script/EmbarkUserSettings.EmbarkGameUserSettings']
+    print("✓ Missing competitive settings not added")
+
+    cm.current_config = {'SystemSettings': {'r.MaxAnisotropy': '4'}}
+    assert cm.apply_preset('Competitive')
+    assert cm.current_config['SystemSettings'] == {
+        'r.MaxAnisotropy': PRESETS['Competitive']['settings']['r.MaxAnisotropy'],
+    }
+    print("✓ Competitive settings already in config are applied")
+
+    assert not cm.apply_preset('No Such Preset')
+    print("✓ Unknown preset rejected")
+
 
 def test_config_manager_init():
     """Test ConfigManager initialization."""
@@ -149,6 +397,7 @@ def test_config_manager_init():
     assert cm.backup_dir is None
     assert cm.profiles_dir is None
     assert cm.current_config == {}
+    assert not hasattr(cm, '__dict__'), "ConfigManager should use __slots__"
     
     print("✓ ConfigManager initializes correctly")
 
@@ -157,22 +406,7 @@ def test_config_read_write():
     """Test reading and writing config files."""
     print("\n=== Testing Config Read/Write ===")
     
-    # Create a temporary config file
-    with tempfile.NamedTemporaryFile(mode='w', suffix='.ini', delete=False) as f:
-        f.write("""[/Script/EmbarkUserSettings.EmbarkGameUserSettings]
-DLSSMode=Quality
-NvReflexMode=Enabled
-bUseVSync=False
-FrameRateLimit=0.000000
-
-[ScalabilityGroups]
-sg.ShadowQuality=3
-sg.TextureQuality=3
-sg.ResolutionQuality=100
-""")
-        temp_path = Path(f.name)
-    
-    try:
+    with _temp_config(_EMBARK_INI) as temp_path:
         cm = ConfigManager()
         result = cm.initialize(temp_path)
         assert result, "Failed to initialize with temp config"
@@ -207,28 +441,78 @@ sg.ResolutionQuality=100
         cm2.initialize(temp_path)
         config2 = cm2.read_config()
         assert config2['/Script/EmbarkUserSettings.EmbarkGameUserSettings']['DLSSMode'] == 'Performance'
+        assert not temp_path.with_name(f".{temp_path.name}.tmp").exists(), "Temp file left behind"
         print("✓ Written config verified")
-        
-    finally:
-        # Cleanup
-        temp_path.unlink()
-        if cm.backup_dir and cm.backup_dir.exists():
-            import shutil
-            shutil.rmtree(cm.backup_dir, ignore_errors=True)
-        if cm.profiles_dir and cm.profiles_dir.exists():
-            import shutil
-            shutil.rmtree(cm.profiles_dir, ignore_errors=True)
+
+        # The temp-file swap keeps the config's permissions
+        if os.name != 'nt':
+            temp_path.chmod(0o444)
+            assert cm.write_config(cm.current_config), "Failed to write read-only config"
+            assert stat.S_IMODE(temp_path.stat().st_mode) == 0o444, "Write changed the config's mode"
+            print("✓ Write keeps config permissions")
+
+
+def test_config_read_cache():
+    """Test that re-reading an unchanged config is cached but isolated."""
+    print("\n=== Testing Config Read Cache ===")
+
+    with _temp_config(b"[ScalabilityGroups]\nsg.ShadowQuality=3\n") as temp_path:
+        cm = ConfigManager()
+        cm.initialize(temp_path)
+        first = cm.read_config()
+        first['ScalabilityGroups']['sg.ShadowQuality'] = '0'
+
+        second = cm.read_config()
+        assert second['ScalabilityGroups']['sg.ShadowQuality'] == '3', \
+            "Mutating a read result should not affect later reads"
+        print("✓ Cached reads return independent copies")
+
+        temp_path.write_text("[ScalabilityGroups]\nsg.ShadowQuality=1\nsg.TextureQuality=2\n")
+        third = cm.read_config()
+        assert third['ScalabilityGroups'] == {'sg.ShadowQuality': '1', 'sg.TextureQuality': '2'}, \
+            "Changed file should be re-parsed"
+        print("✓ Changed file is re-read")
+
+        temp_path.write_bytes(b"\xef\xbb\xbf[ScalabilityGroups]\r\nsg.ShadowQuality=2\r\n")
+        assert cm.read_config() == {'ScalabilityGroups': {'sg.ShadowQuality': '2'}}, \
+            "UTF-8 BOM should be ignored"
+        print("✓ UTF-8 BOM handled")
+
+
+def test_ini_parse_dump():
+    """Test the UE INI parser and serializer."""
+    print("\n=== Testing INI Parse/Dump ===")
+
+    text = ("Orphan=ignored\n"
+            "[/Script/Engine.InputSettings]\n"
+            "bEnableMouseSmoothing = False\n"
+            "ConsoleKeys=Tilde\n"
+            "\n"
+            "[SystemSettings]\n"
+            "r.Tonemapper.Sharpen=0.5%\n"
+            "NoValueLine\n")
+    config = arc_tuner.parse_ini(text)
+    assert list(config) == ['/Script/Engine.InputSettings', 'SystemSettings']
+    assert config['/Script/Engine.InputSettings'] == {
+        'bEnableMouseSmoothing': 'False',
+        'ConsoleKeys': 'Tilde',
+    }, "Keys should keep their case and be stripped"
+    assert config['SystemSettings'] == {'r.Tonemapper.Sharpen': '0.5%'}
+    assert arc_tuner.parse_ini("[A]\n+Paths=1\n+Paths=2\n") == {'A': {'+Paths': '2'}}, \
+        "Repeated keys should keep the last value"
+    print("✓ INI parsed correctly")
+
+    assert arc_tuner.parse_ini(arc_tuner.dump_ini(config)) == config
+    assert arc_tuner.dump_ini({'A': {'k': 'v'}}) == "[A]\nk=v\n\n"
+    assert arc_tuner.dump_ini({}) == ""
+    print("✓ INI round-trips through dump_ini")
 
 
 def test_backup_system():
     """Test backup creation and listing."""
     print("\n=== Testing Backup System ===")
     
-    with tempfile.NamedTemporaryFile(mode='w', suffix='.ini', delete=False) as f:
-        f.write("[Test]\nkey=value\n")
-        temp_path = Path(f.name)
-    
-    try:
+    with _temp_config(_TRIVIAL_INI) as temp_path:
         cm = ConfigManager()
         cm.initialize(temp_path)
         
@@ -236,32 +520,28 @@ def test_backup_system():
         backup_path = cm.create_backup("test")
         assert backup_path is not None, "Backup creation failed"
         assert backup_path.exists(), "Backup file doesn't exist"
+        assert backup_path.read_text() == temp_path.read_text(), "Backup content differs"
+        assert not list(cm.backup_dir.glob(".*.tmp")), "Temp file left behind"
         print(f"✓ Backup created: {backup_path.name}")
         
         # List backups
         backups = cm.list_backups()
         assert len(backups) >= 1, "Backup not listed"
         print(f"✓ Found {len(backups)} backup(s)")
-        
-    finally:
-        temp_path.unlink()
-        if cm.backup_dir and cm.backup_dir.exists():
-            import shutil
-            shutil.rmtree(cm.backup_dir, ignore_errors=True)
-        if cm.profiles_dir and cm.profiles_dir.exists():
-            import shutil
-            shutil.rmtree(cm.profiles_dir, ignore_errors=True)
+
+        # Restoring swaps in a new file but keeps the config's permissions
+        if os.name != 'nt':
+            temp_path.chmod(0o444)
+            assert cm.restore_backup(backup_path), "Restore failed"
+            assert stat.S_IMODE(temp_path.stat().st_mode) == 0o444, "Restore changed the config's mode"
+            print("✓ Restore keeps config permissions")
 
 
 def test_profile_system():
     """Test profile save/load."""
     print("\n=== Testing Profile System ===")
     
-    with tempfile.NamedTemporaryFile(mode='w', suffix='.ini', delete=False) as f:
-        f.write("[Test]\nkey=value\n")
-        temp_path = Path(f.name)
-    
-    try:
+    with _temp_config(_TRIVIAL_INI) as temp_path:
         cm = ConfigManager()
         cm.initialize(temp_path)
         cm.read_config()
@@ -281,21 +561,24 @@ def test_profile_system():
         loaded = cm.load_profile("Test Profile")
         assert loaded is not None, "Profile load failed"
         assert loaded['Test']['key'] == 'new_value'
+        loaded['Test']['key'] = 'edited'
+        assert cm.load_profile("Test Profile")['Test']['key'] == 'new_value', \
+            "Edits to a loaded profile leaked into the next load"
         print("✓ Profile loaded correctly")
+
+        # Re-saving a same-size profile within the mtime granularity (e.g. 2s
+        # on FAT/exFAT) must not return the previously cached content
+        profile_path = cm.profiles_dir / "Test_Profile.json"
+        before = profile_path.stat()
+        assert cm.save_profile("Test Profile", {'Test': {'key': 'new_valuf'}})
+        os.utime(profile_path, ns=(before.st_atime_ns, before.st_mtime_ns))
+        assert cm.load_profile("Test Profile")['Test']['key'] == 'new_valuf', "Stale cached profile"
+        print("✓ Re-saved profile reloaded")
         
         # Delete profile
         result = cm.delete_profile("Test Profile")
         assert result, "Profile delete failed"
         print("✓ Profile deleted")
-        
-    finally:
-        temp_path.unlink()
-        if cm.backup_dir and cm.backup_dir.exists():
-            import shutil
-            shutil.rmtree(cm.backup_dir, ignore_errors=True)
-        if cm.profiles_dir and cm.profiles_dir.exists():
-            import shutil
-            shutil.rmtree(cm.profiles_dir, ignore_errors=True)
 
 
 def test_path_validation():
@@ -307,9 +590,16 @@ def test_path_validation():
     # Should accept valid paths
     valid_path = Path(tempfile.gettempdir()) / "test.ini"
     # Note: validate_path checks suffix, so this should work
+    assert cm.validate_path(valid_path), "Temp .ini path should be valid"
+    assert not cm.validate_path(Path(tempfile.gettempdir()) / "test.exe"), \
+        "Unexpected extension should be rejected"
 
-    # Should reject system paths (on Windows)
+    # Should reject system paths
     # This test is platform-specific
+    if arc_tuner.IS_LINUX:
+        assert not cm.validate_path(Path("/etc/test.ini")), "/etc should be forbidden"
+    elif arc_tuner.IS_WINDOWS:
+        assert not cm.validate_path(Path("C:/Windows/test.ini")), "C:/Windows should be forbidden"
     print("✓ Path validation logic exists")
 
 
@@ -321,9 +611,6 @@ def test_platform_constants():
     """Test that platform detection constants are defined."""
     print("\n=== Testing Platform Constants ===")
 
-    # Import the module to check for platform constants
-    import arc_tuner
-
     # Check that platform detection constants exist
     assert hasattr(arc_tuner, 'IS_WINDOWS'), "IS_WINDOWS constant not defined"
     assert hasattr(arc_tuner, 'IS_LINUX'), "IS_LINUX constant not defined"
@@ -346,18 +633,16 @@ def test_find_steam_path_linux():
     """Test finding Steam installation on Linux."""
     print("\n=== Testing find_steam_path() - Linux ===")
 
-    import arc_tuner
-
-    # Mock Path.exists and Path.is_dir
-    with patch('pathlib.Path.exists') as mock_exists, \
-         patch('pathlib.Path.is_dir') as mock_is_dir:
+    # Mock Path.is_dir, which find_steam_path probes each candidate with
+    with patch('pathlib.Path.is_dir', autospec=True) as mock_is_dir, \
+         patch.object(arc_tuner, 'IS_WINDOWS', False), \
+         patch.object(arc_tuner, 'IS_LINUX', True):
 
         # Test case 1: Standard Linux Steam location
-        def exists_standard(self):
-            return str(self) == str(Path.home() / ".local/share/Steam")
+        def is_dir_standard(self, target=Path.home() / ".local/share/Steam"):
+            return self == target
 
-        mock_exists.side_effect = exists_standard
-        mock_is_dir.return_value = True
+        mock_is_dir.side_effect = is_dir_standard
 
         result = arc_tuner.find_steam_path()
         assert result == Path.home() / ".local/share/Steam", \
@@ -365,10 +650,10 @@ def test_find_steam_path_linux():
         print("✓ Found Steam in standard Linux location")
 
         # Test case 2: Flatpak Steam location
-        def exists_flatpak(self):
-            return str(self) == str(Path.home() / ".var/app/com.valvesoftware.Steam/.local/share/Steam")
+        def is_dir_flatpak(self, target=Path.home() / ".var/app/com.valvesoftware.Steam/.local/share/Steam"):
+            return self == target
 
-        mock_exists.side_effect = exists_flatpak
+        mock_is_dir.side_effect = is_dir_flatpak
 
         result = arc_tuner.find_steam_path()
         assert result == Path.home() / ".var/app/com.valvesoftware.Steam/.local/share/Steam", \
@@ -376,7 +661,8 @@ def test_find_steam_path_linux():
         print("✓ Found Steam in Flatpak location")
 
         # Test case 3: Steam not installed
-        mock_exists.return_value = False
+        mock_is_dir.side_effect = None
+        mock_is_dir.return_value = False
 
         result = arc_tuner.find_steam_path()
         assert result is None, "Should return None when Steam not found"
@@ -387,20 +673,18 @@ def test_find_steam_path_windows():
     """Test finding Steam installation on Windows."""
     print("\n=== Testing find_steam_path() - Windows ===")
 
-    import arc_tuner
-
-    with patch('pathlib.Path.exists') as mock_exists, \
-         patch('pathlib.Path.is_dir') as mock_is_dir:
+    with patch('pathlib.Path.is_dir', autospec=True) as mock_is_dir, \
+         patch.object(arc_tuner, 'IS_WINDOWS', True), \
+         patch.object(arc_tuner, 'IS_LINUX', False):
 
         # Test case: Standard Windows Steam location (Program Files)
         program_files = Path("C:/Program Files (x86)")
         steam_path = program_files / "Steam"
 
-        def exists_windows(self):
-            return str(self) == str(steam_path)
+        def is_dir_windows(self, target=steam_path):
+            return self == target
 
-        mock_exists.side_effect = exists_windows
-        mock_is_dir.return_value = True
+        mock_is_dir.side_effect = is_dir_windows
 
         result = arc_tuner.find_steam_path()
         assert result == steam_path, f"Should find Windows Steam path, got {result}"
@@ -411,8 +695,6 @@ def test_parse_vdf_library_folders():
     """Test parsing libraryfolders.vdf file."""
     print("\n=== Testing parse_vdf_library_folders() ===")
 
-    import arc_tuner
-
     # Test case 1: Valid VDF with single library
     vdf_single = '''
 "libraryfolders"
@@ -487,23 +769,20 @@ def test_find_proton_prefix():
     """Test finding Proton prefix for a game."""
     print("\n=== Testing find_proton_prefix() ===")
 
-    import arc_tuner
-
     app_id = "1808500"  # Arc Raiders
 
-    with patch('pathlib.Path.exists') as mock_exists, \
-         patch('pathlib.Path.is_dir') as mock_is_dir, \
+    with patch('pathlib.Path.is_dir', autospec=True) as mock_is_dir, \
+         patch('pathlib.Path.read_text', autospec=True) as mock_read_text, \
          patch.object(arc_tuner, 'find_steam_path') as mock_find_steam:
 
-        # Test case 1: Game installed in default library
+        # Test case 1: Game installed in default library (no libraryfolders.vdf)
         mock_find_steam.return_value = Path("/home/user/.local/share/Steam")
+        mock_read_text.side_effect = FileNotFoundError
 
-        def exists_default(self):
-            expected = Path("/home/user/.local/share/Steam/steamapps/compatdata") / app_id
-            return str(self) == str(expected)
+        def is_dir_default(self, target=Path("/home/user/.local/share/Steam/steamapps/compatdata") / app_id / "pfx"):
+            return self == target
 
-        mock_exists.side_effect = exists_default
-        mock_is_dir.return_value = True
+        mock_is_dir.side_effect = is_dir_default
 
         result = arc_tuner.find_proton_prefix(app_id)
         expected_prefix = Path("/home/user/.local/share/Steam/steamapps/compatdata") / app_id
@@ -511,7 +790,8 @@ def test_find_proton_prefix():
         print("✓ Found Proton prefix in default library")
 
         # Test case 2: Game not installed (returns None)
-        mock_exists.return_value = False
+        mock_is_dir.side_effect = None
+        mock_is_dir.return_value = False
 
         result = arc_tuner.find_proton_prefix(app_id)
         assert result is None, "Should return None when game not found"
@@ -529,13 +809,10 @@ def test_find_proton_prefix_secondary_library():
     """Test finding Proton prefix in secondary Steam library."""
     print("\n=== Testing find_proton_prefix() - Secondary Library ===")
 
-    import arc_tuner
-
     app_id = "1808500"
 
-    with patch('pathlib.Path.exists') as mock_exists, \
-         patch('pathlib.Path.is_dir') as mock_is_dir, \
-         patch('pathlib.Path.read_text') as mock_read_text, \
+    with patch('pathlib.Path.is_dir', autospec=True) as mock_is_dir, \
+         patch('pathlib.Path.read_text', autospec=True) as mock_read_text, \
          patch.object(arc_tuner, 'find_steam_path') as mock_find_steam, \
          patch.object(arc_tuner, 'parse_vdf_library_folders') as mock_parse_vdf:
 
@@ -549,13 +826,12 @@ def test_find_proton_prefix_secondary_library():
             Path("/media/nvme/Steam")
         ]
 
-        # Mock that game exists in second library
-        def exists_secondary(self):
-            expected = Path("/mnt/games/SteamLibrary/steamapps/compatdata") / app_id
-            return str(self) == str(expected)
+        # Mock that all libraries exist and the game is in the second one
+        def is_dir_secondary(self, target=Path("/mnt/games/SteamLibrary/steamapps/compatdata") / app_id / "pfx",
+                             libraries=frozenset(mock_parse_vdf.return_value)):
+            return self == target or self in libraries
 
-        mock_exists.side_effect = exists_secondary
-        mock_is_dir.return_value = True
+        mock_is_dir.side_effect = is_dir_secondary
 
         # Mock reading libraryfolders.vdf
         mock_read_text.return_value = '{"libraryfolders": {}}'
@@ -570,8 +846,6 @@ def test_get_default_config_path_windows():
     """Test get_default_config_path() on Windows."""
     print("\n=== Testing get_default_config_path() - Windows ===")
 
-    import arc_tuner
-
     with patch.dict(os.environ, {'LOCALAPPDATA': 'C:/Users/TestUser/AppData/Local'}), \
          patch.object(arc_tuner, 'IS_WINDOWS', True), \
          patch.object(arc_tuner, 'IS_LINUX', False):
@@ -587,8 +861,6 @@ def test_get_default_config_path_linux():
     """Test get_default_config_path() on Linux/SteamOS."""
     print("\n=== Testing get_default_config_path() - Linux ===")
 
-    import arc_tuner
-
     with patch.object(arc_tuner, 'IS_WINDOWS', False), \
          patch.object(arc_tuner, 'IS_LINUX', True), \
          patch.object(arc_tuner, 'find_proton_prefix') as mock_find_prefix:
@@ -615,18 +887,18 @@ def test_config_path_integration():
     """Test the full config path resolution chain."""
     print("\n=== Testing Config Path Integration ===")
 
-    import arc_tuner
-
     # Test that ConfigManager uses get_default_config_path()
     with patch.object(arc_tuner, 'get_default_config_path') as mock_get_path:
         mock_get_path.return_value = Path("/tmp/test/GameUserSettings.ini")
 
         # ConfigManager should use the platform-aware path function
-        # Note: This test verifies the integration exists
         cm = ConfigManager()
+        mock_get_path.assert_not_called()
 
-        # The DEFAULT_CONFIG_PATH should be set using get_default_config_path()
-        # or the initialize method should call it
+        # initialize() resolves the default path when none is given
+        assert not cm.initialize(), "Nonexistent default config should not initialize"
+        mock_get_path.assert_called_once()
+        assert cm.config_path == Path("/tmp/test/GameUserSettings.ini")
         print("✓ ConfigManager integration with platform detection")
 
 
@@ -634,8 +906,6 @@ def test_vdf_parsing_edge_cases():
     """Test VDF parsing with various edge cases."""
     print("\n=== Testing VDF Parsing Edge Cases ===")
 
-    import arc_tuner
-
     # Test case 1: Windows-style paths in VDF
     vdf_windows = '''
 "libraryfolders"
@@ -689,9 +959,18 @@ def run_tests():
     
     tests = [
         test_setting_definitions,
+        test_setting_definition_immutable,
+        test_choice_options_normalized,
+        test_var_converters,
+        test_settings_by_category,
+        test_competitive_refresh_shared_key,
+        test_validate_setting_value,
         test_presets,
         test_config_manager_init,
+        test_config_manager_apply_preset,
         test_config_read_write,
+        test_config_read_cache,
+        test_ini_parse_dump,
         test_backup_system,
         test_profile_system,
         test_path_validation,